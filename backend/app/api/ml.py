@@ -31,7 +31,7 @@ def train_ml_models(request: MLTrainRequest, db: Session = Depends(get_db)):
     - Machine Learning - Delta
     - Machine Learning - Nova
     
-    Also trains Linear Regression (statsmodels OLS) with coefficient details.
+    Also trains Linear Regression (OLS) with coefficient details.
     """
     # Get dataset
     dataset = db.query(Dataset).filter(Dataset.id == request.dataset_id).first()
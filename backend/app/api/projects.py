@@ -22,16 +22,16 @@ from app.schemas.schemas import (
     ProjectRunList,
     ProjectTrainConfig,
     ProjectStatus,
-    ProjectInputField,
 )
 from app.services.project_service import (
     create_project,
     get_project,
-    list_projects,
+    list_projects_summary,
     list_project_runs,
     update_project,
     delete_project,
     log_project_run,
+    get_input_schema,
 )
 from app.services.ml_service import predict as ml_predict
 
@@ -59,7 +59,7 @@ def create_new_project(project: ProjectCreate, db: Session = Depends(get_db)):
             model_label=db_project.model_label,
             target=db_project.target,
             features=db_project.features,
-            input_schema=[ProjectInputField(**f) for f in (db_project.input_schema or [])],
+            input_schema=get_input_schema(db_project),
             train_config=ProjectTrainConfig(**(db_project.train_config or {})),
             model_metrics=db_project.model_metrics or {},
             status=ProjectStatus(db_project.status),
@@ -77,14 +77,14 @@ def create_new_project(project: ProjectCreate, db: Session = Depends(get_db)):
 @router.get("/", response_model=ProjectList)
 def list_all_projects(limit: int = 200, offset: int = 0, db: Session = Depends(get_db)):
     """List projects (most recently updated first)."""
-    projects, total = list_projects(db, limit=limit, offset=offset)
+    rows, total = list_projects_summary(db, limit=limit, offset=offset)
     summaries: list[ProjectSummary] = []
-    for p in projects:
+    for p in rows:
         summaries.append(ProjectSummary(
             id=p.id,
             name=p.name,
             dataset_id=p.dataset_id,
-            dataset_name=_dataset_name(db, p.dataset_id),
+            dataset_name=p.dataset_name,
             model_label=p.model_label,
             target=p.target,
             status=ProjectStatus(p.status),
@@ -111,7 +111,7 @@ def get_project_by_id(project_id: int, db: Session = Depends(get_db)):
         model_label=p.model_label,
         target=p.target,
         features=p.features,
-        input_schema=[ProjectInputField(**f) for f in (p.input_schema or [])],
+        input_schema=get_input_schema(p),
         train_config=ProjectTrainConfig(**(p.train_config or {})),
         model_metrics=p.model_metrics or {},
         status=ProjectStatus(p.status),
@@ -137,7 +137,7 @@ def update_existing_project(project_id: int, update: ProjectUpdate, db: Session
         model_label=p.model_label,
         target=p.target,
         features=p.features,
-        input_schema=[ProjectInputField(**f) for f in (p.input_schema or [])],
+        input_schema=get_input_schema(p),
         train_config=ProjectTrainConfig(**(p.train_config or {})),
         model_metrics=p.model_metrics or {},
         status=ProjectStatus(p.status),
@@ -169,9 +169,8 @@ def predict_from_project(project_id: int, request: ProjectPredictRequest, db: Se
     input_values = dict(request.input_values or {})
 
     # Use project input_schema to decide missing defaults for categorical fields.
-    schema = p.input_schema or []
-    for field in schema:
-        col_key = field.get("col_key")
+    for field in get_input_schema(p):
+        col_key = field.col_key
         if not col_key:
             continue
 
@@ -179,8 +178,7 @@ def predict_from_project(project_id: int, request: ProjectPredictRequest, db: Se
             continue
 
         # Default behavior matches training pipeline handling.
-        input_type = field.get("input_type")
-        if input_type == "select":
+        if field.input_type == "select":
             input_values[col_key] = "MISSING"
         else:
             input_values[col_key] = 0
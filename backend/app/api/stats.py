@@ -145,6 +145,7 @@ def get_normality(request: NormalityRequest, db: Session = Depends(get_db)):
             filters=request.filters if request.filters else None,
             alpha=request.alpha,
             treat_missing_as_zero=request.treat_missing_as_zero,
+            include_interpretation=request.include_interpretation,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error testing normality: {str(e)}")
@@ -1,7 +1,7 @@
 """
 Orion Analytics - Database Models
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, JSON, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -68,7 +68,8 @@ class Project(Base):
     status = Column(String(32), nullable=False, default="active")  # draft|active|archived
 
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Indexed: list endpoints order by recency
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     dataset = relationship("Dataset", back_populates="projects")
@@ -78,6 +79,10 @@ class Project(Base):
 class ProjectRun(Base):
     """Single prediction execution for a project (audit/history)."""
     __tablename__ = "project_runs"
+    # Run history is always "latest runs of one project"
+    __table_args__ = (
+        Index("ix_project_runs_project_id_created_at", "project_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -1,6 +1,7 @@
 """
 Orion Analytics - Database Session
 """
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
@@ -9,14 +10,25 @@ from app.core.config import settings
 from app.db.models import Base
 
 
-# Create engine
+def _json_serializer(value) -> str:
+    return orjson.dumps(value).decode()
+
+
+# Create engine; orjson codecs cover every JSON column (scenario payloads,
+# project input schemas, columns_meta) far faster than stdlib json
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Required for SQLite
+    connect_args={"check_same_thread": False},  # Required for SQLite
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Sessions are request-scoped and all column
+# defaults are Python-side, so objects stay valid after commit without the
+# reload SELECT that expire-on-commit would trigger on first access.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 def init_db():
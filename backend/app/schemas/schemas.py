@@ -249,7 +249,7 @@ class NormalityResult(BaseModel):
     overall_normal: bool
     skewness: float
     kurtosis: float
-    interpretation: str
+    interpretation: Optional[str] = None
 
 
 class NormalityRequest(BaseModel):
@@ -259,6 +259,7 @@ class NormalityRequest(BaseModel):
     variables: list[str]
     alpha: float = 0.05
     treat_missing_as_zero: bool = True
+    include_interpretation: bool = True  # False skips per-variable text for dashboards
 
 
 class NormalityResponse(BaseModel):
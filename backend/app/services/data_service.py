@@ -139,6 +139,20 @@ def apply_filters(df: pd.DataFrame, filters: list[FilterCondition]) -> pd.DataFr
     return filtered_df
 
 
+def apply_filters_mask(df: pd.DataFrame, filters: list[FilterCondition]) -> np.ndarray:
+    """
+    Boolean row mask for filter conditions, for callers that only need
+    per-column views and can skip materializing a filtered DataFrame.
+    """
+    mask = np.ones(len(df.index), dtype=bool)
+
+    for filter_cond in filters:
+        if filter_cond.col_key in df.columns and filter_cond.values:
+            mask &= df[filter_cond.col_key].isin(filter_cond.values).to_numpy()
+
+    return mask
+
+
 def get_unique_values(df: pd.DataFrame, col_key: str) -> list[Any]:
     """Get unique values for a column."""
     if col_key not in df.columns:
@@ -4,13 +4,14 @@ Generates Excel exports with multiple sheets.
 """
 import io
 import pandas as pd
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from openpyxl import Workbook
-from openpyxl.drawing.image import Image as XLImage
-from openpyxl.chart import BarChart, Reference
-from openpyxl.chart.label import DataLabelList
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from typing import Optional, Any
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.utils import get_column_letter
+from typing import Optional, Any, Literal
 
 from app.schemas.schemas import FilterCondition
 from app.services.stats_service import calculate_descriptive_stats
@@ -27,15 +28,47 @@ BORDER = Border(
 )
 BANNER_FILL = PatternFill(start_color="0D1421", end_color="0D1421", fill_type="solid")
 
+BODY_STYLE_NAME = "orion_body"
+HEADER_STYLE_NAME = "orion_header"
+
+
+def _ensure_body_style(wb) -> str:
+    """Register the shared body NamedStyle once per workbook and return its name."""
+    if BODY_STYLE_NAME not in wb.named_styles:
+        wb.add_named_style(NamedStyle(name=BODY_STYLE_NAME, font=CELL_FONT, border=BORDER))
+    return BODY_STYLE_NAME
+
+
+def _ensure_header_style(wb) -> str:
+    """Register the shared header NamedStyle once per workbook and return its name."""
+    if HEADER_STYLE_NAME not in wb.named_styles:
+        wb.add_named_style(NamedStyle(
+            name=HEADER_STYLE_NAME,
+            font=HEADER_FONT,
+            fill=HEADER_FILL,
+            border=BORDER,
+            alignment=Alignment(horizontal="center"),
+        ))
+    return HEADER_STYLE_NAME
+
+
+def _append_styled_rows(ws, rows, start_row: int, style_name: Optional[str] = None):
+    """Append rows below start_row in bulk, applying one shared style per cell."""
+    if style_name is None:
+        style_name = _ensure_body_style(ws.parent)
+    # append() continues from the worksheet cursor, not from max_row.
+    ws._current_row = start_row
+    for row_values in rows:
+        ws.append(row_values)
+        for cell in ws[ws._current_row][:len(row_values)]:
+            cell.style = style_name
+
 
 def _style_header(ws, row, max_col):
     """Apply header styling to a row."""
+    style_name = _ensure_header_style(ws.parent)
     for col in range(1, max_col + 1):
-        cell = ws.cell(row=row, column=col)
-        cell.fill = HEADER_FILL
-        cell.font = HEADER_FONT
-        cell.alignment = Alignment(horizontal="center")
-        cell.border = BORDER
+        ws.cell(row=row, column=col).style = style_name
 
 
 def _resolve_logo_path() -> Optional[Path]:
@@ -52,6 +85,21 @@ def _resolve_logo_path() -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=1)
+def _logo_path_cached() -> Optional[Path]:
+    """Probe the filesystem for the logo once per process."""
+    return _resolve_logo_path()
+
+
+@lru_cache(maxsize=1)
+def _logo_bytes_cached() -> Optional[bytes]:
+    """Read the logo PNG from disk once per process."""
+    logo_path = _logo_path_cached()
+    if not logo_path:
+        return None
+    return logo_path.read_bytes()
+
+
 def _paint_banner(ws, start_row=1, end_row=6, end_col=16):
     """Paint a dark brand banner area in the worksheet."""
     for row in range(start_row, end_row + 1):
@@ -62,11 +110,15 @@ def _paint_banner(ws, start_row=1, end_row=6, end_col=16):
 
 def _insert_logo(ws, anchor_cell="A1", max_width=260):
     """Insert ORION wordmark if available."""
-    logo_path = _resolve_logo_path()
-    if not logo_path:
+    logo_bytes = _logo_bytes_cached()
+    if not logo_bytes:
         return
     try:
-        img = XLImage(str(logo_path))
+        # Deferred: openpyxl.drawing pulls in PIL, which most exports
+        # without branding never need.
+        from openpyxl.drawing.image import Image as XLImage
+
+        img = XLImage(io.BytesIO(logo_bytes))
         if img.width > max_width:
             ratio = max_width / float(img.width)
             img.width = int(img.width * ratio)
@@ -77,14 +129,24 @@ def _insert_logo(ws, anchor_cell="A1", max_width=260):
         return
 
 
-def _auto_width(ws, max_width=28):
-    """Auto-size worksheet columns with a max width cap."""
-    for col in ws.columns:
-        max_length = 0
-        for cell in col:
-            if cell.value is not None:
-                max_length = max(max_length, len(str(cell.value)))
-        ws.column_dimensions[col[0].column_letter].width = min(max_length + 2, max_width)
+def _set_column_widths(ws, headers: list[str], rows: list[list[Any]], max_width=28):
+    """
+    Size columns from the header/data lists already in hand, instead of
+    re-scanning every worksheet cell after the fact.
+    """
+    widths = [len(str(h)) for h in headers]
+    for row_values in rows:
+        for idx, value in enumerate(row_values):
+            if value is None:
+                continue
+            length = len(str(value))
+            if length > widths[idx]:
+                widths[idx] = length
+
+    for idx, width in enumerate(widths, 1):
+        letter = get_column_letter(idx)
+        current = ws.column_dimensions[letter].width or 0
+        ws.column_dimensions[letter].width = max(current, min(width + 2, max_width))
 
 
 def _write_simple_table(ws, headers: list[str], rows: list[list[Any]], start_row=1):
@@ -93,47 +155,103 @@ def _write_simple_table(ws, headers: list[str], rows: list[list[Any]], start_row
         ws.cell(row=start_row, column=col_idx, value=header)
     _style_header(ws, start_row, len(headers))
 
-    for row_idx, row_values in enumerate(rows, start_row + 1):
-        for col_idx, value in enumerate(row_values, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.font = CELL_FONT
-            cell.border = BORDER
+    _append_styled_rows(ws, rows, start_row)
 
-    _auto_width(ws)
+    _set_column_widths(ws, headers, rows)
     return start_row + len(rows) + 1
 
 
+STATS_HEADERS = [
+    "Variavel", "N", "Ausentes", "% Ausentes", "Media", "Mediana", "Moda",
+    "D. Padrao", "Variancia", "CV%", "SEM", "Min", "Max", "Amplitude",
+    "Q1", "Q3", "IQR", "P5", "P10", "P90", "P95",
+    "Assimetria", "Curtose", "IC Inf", "IC Sup", "Soma"
+]
+
+
+# One C-level fetch of all stat attributes in STATS_HEADERS column order.
+_STAT_GET = attrgetter(
+    "name", "count", "missing_count", "missing_pct",
+    "mean", "median", "mode", "std", "variance",
+    "cv", "sem", "min", "max", "range",
+    "q1", "q3", "iqr", "p5", "p10", "p90", "p95",
+    "skewness", "kurtosis", "ci_lower", "ci_upper", "sum",
+)
+
+
+def _stat_row(stat) -> list[Any]:
+    """Flatten a stat object into the STATS_HEADERS column order."""
+    return list(_STAT_GET(stat))
+
+
 def _write_stats_table(ws, stats_list, start_row=1):
     """Write statistics to a worksheet."""
-    headers = [
-        "Variavel", "N", "Ausentes", "% Ausentes", "Media", "Mediana", "Moda",
-        "D. Padrao", "Variancia", "CV%", "SEM", "Min", "Max", "Amplitude",
-        "Q1", "Q3", "IQR", "P5", "P10", "P90", "P95",
-        "Assimetria", "Curtose", "IC Inf", "IC Sup", "Soma"
-    ]
+    headers = STATS_HEADERS
 
     for col_idx, header in enumerate(headers, 1):
         ws.cell(row=start_row, column=col_idx, value=header)
     _style_header(ws, start_row, len(headers))
 
-    for row_idx, stat in enumerate(stats_list, start_row + 1):
-        values = [
-            stat.name, stat.count, stat.missing_count, stat.missing_pct,
-            stat.mean, stat.median, stat.mode, stat.std, stat.variance,
-            stat.cv, stat.sem, stat.min, stat.max, stat.range,
-            stat.q1, stat.q3, stat.iqr, stat.p5, stat.p10, stat.p90, stat.p95,
-            stat.skewness, stat.kurtosis, stat.ci_lower, stat.ci_upper, stat.sum,
-        ]
-        for col_idx, value in enumerate(values, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.font = CELL_FONT
-            cell.border = BORDER
+    rows = [_stat_row(stat) for stat in stats_list]
+    _append_styled_rows(ws, rows, start_row)
 
-    _auto_width(ws, max_width=20)
+    _set_column_widths(ws, headers, rows, max_width=20)
 
     return start_row + len(stats_list) + 1
 
 
+GROUP_REPORT_HEADERS = [
+    "Grupo", "N Grupo", "% Total",
+    "Variavel", "N", "Ausentes", "% Ausentes",
+    "Media", "Mediana", "Moda", "DP", "Variancia", "CV%", "SEM",
+    "Min", "Max", "Amplitude", "Q1", "Q3", "IQR",
+    "P5", "P10", "P90", "P95", "Assimetria", "Curtose",
+    "IC Inf", "IC Sup", "Soma"
+]
+
+RANKING_HEADERS = [
+    "Variavel", "Ranking", "Grupo",
+    "Media", "DP", "CV%", "Mediana",
+    "Min", "Max", "Amplitude", "N", "IC Inf", "IC Sup"
+]
+
+COMPARISON_HEADERS = [
+    "Variavel",
+    "Teste",
+    "Estatistica",
+    "p-valor",
+    "Significativo",
+    "Tamanho Efeito",
+    "Interpretacao",
+    "Explicacao Pratica",
+]
+
+
+def _comparison_rows(tests) -> list[list[Any]]:
+    """Flatten comparison tests into COMPARISON_HEADERS column order."""
+    return [
+        [
+            test.variable_name, test.test_name_display,
+            test.statistic, test.p_value,
+            "Sim" if test.significant else "Nao",
+            f"{test.effect_size_name} = {test.effect_size}" if test.effect_size is not None else "-",
+            test.interpretation,
+            test.practical_explanation or "-",
+        ]
+        for test in tests
+    ]
+
+
+def _index_grouped(grouped) -> dict[Any, dict[str, Any]]:
+    """Index grouped stats as {group_key: {col_key: stat}} for O(1) lookups."""
+    return {gk: {s.col_key: s for s in gs} for gk, gs in grouped.items()}
+
+
+def _variable_labels(variables: list[str], columns_meta: dict[str, str]) -> dict[str, str]:
+    """Resolve display labels once per call instead of per loop iteration."""
+    return {v: columns_meta.get(v, v) for v in variables}
+
+
 def _group_summary_maps(group_summaries):
     sample_size_map = {}
     pct_total_map = {}
@@ -175,37 +293,7 @@ def _build_group_report_rows(grouped, group_summaries):
         group_n = group_n_map.get(group_key)
         group_pct = group_pct_map.get(group_key)
         for stat in group_stats:
-            rows.append([
-                group_key,
-                group_n,
-                group_pct,
-                stat.name,
-                stat.count,
-                stat.missing_count,
-                stat.missing_pct,
-                stat.mean,
-                stat.median,
-                stat.mode,
-                stat.std,
-                stat.variance,
-                stat.cv,
-                stat.sem,
-                stat.min,
-                stat.max,
-                stat.range,
-                stat.q1,
-                stat.q3,
-                stat.iqr,
-                stat.p5,
-                stat.p10,
-                stat.p90,
-                stat.p95,
-                stat.skewness,
-                stat.kurtosis,
-                stat.ci_lower,
-                stat.ci_upper,
-                stat.sum,
-            ])
+            rows.append([group_key, group_n, group_pct, *_STAT_GET(stat)])
     return rows
 
 
@@ -227,43 +315,56 @@ def _build_group_matrix_table(grouped, variables, columns_meta, group_summaries)
         ("count", "N"),
     ]
 
+    labels = _variable_labels(variables, columns_meta)
     headers = ["Grupo", "N Grupo", "% Total"]
     for var in variables:
-        var_name = columns_meta.get(var, var)
+        var_name = labels[var]
         for _, metric_label in metric_defs:
             headers.append(f"{var_name} | {metric_label}")
 
     group_n_map, group_pct_map = _group_summary_maps(group_summaries)
+    metric_getter = attrgetter(*[metric_key for metric_key, _ in metric_defs])
+    empty_metrics = (None,) * len(metric_defs)
+
     rows = []
-    for group_key, group_stats in grouped.items():
-        stats_by_var = {s.col_key: s for s in group_stats}
+    for group_key, stats_by_var in _index_grouped(grouped).items():
         row = [group_key, group_n_map.get(group_key), group_pct_map.get(group_key)]
         for var in variables:
             stat = stats_by_var.get(var)
-            for metric_key, _ in metric_defs:
-                row.append(getattr(stat, metric_key, None) if stat else None)
+            row.extend(metric_getter(stat) if stat else empty_metrics)
         rows.append(row)
 
     return headers, rows
 
 
-def _build_group_ranking_rows(grouped, variables, columns_meta):
+def _rank_entries_by_variable(grouped, variables) -> dict[str, list[tuple[Any, Any]]]:
     """
-    Ranking table sorted by mean (desc) for each selected variable.
+    Rank (group_key, stat) entries by mean (desc) once per variable so the
+    ranking and executive builders don't each re-sort the same data.
     """
-    rows = []
+    stats_by_group = _index_grouped(grouped)
+    ranked = {}
     for var in variables:
-        var_name = columns_meta.get(var, var)
-        variable_entries = []
-        for group_key, group_stats in grouped.items():
-            stat = next((s for s in group_stats if s.col_key == var), None)
+        entries = []
+        for group_key, stats_by_var in stats_by_group.items():
+            stat = stats_by_var.get(var)
             if not stat or stat.mean is None:
                 continue
-            variable_entries.append((group_key, stat))
+            entries.append((group_key, stat))
+        entries.sort(key=lambda x: x[1].mean, reverse=True)
+        ranked[var] = entries
+    return ranked
 
-        variable_entries.sort(key=lambda x: x[1].mean if x[1].mean is not None else float("-inf"), reverse=True)
 
-        for idx, (group_key, stat) in enumerate(variable_entries, 1):
+def _build_group_ranking_rows(ranked, variables, columns_meta):
+    """
+    Ranking table sorted by mean (desc) for each selected variable.
+    """
+    rows = []
+    labels = _variable_labels(variables, columns_meta)
+    for var in variables:
+        var_name = labels[var]
+        for idx, (group_key, stat) in enumerate(ranked.get(var, []), 1):
             rows.append([
                 var_name,
                 idx,
@@ -342,14 +443,10 @@ def _write_table_block(ws, title: str, headers: list[str], rows: list[list[Any]]
         ws.cell(row=header_row, column=col_idx, value=header)
     _style_header(ws, header_row, len(headers))
 
-    for row_idx, row_values in enumerate(rows, header_row + 1):
-        for col_idx, value in enumerate(row_values, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.font = CELL_FONT
-            cell.border = BORDER
+    _append_styled_rows(ws, rows, header_row)
 
     data_end_row = header_row + len(rows)
-    _auto_width(ws, max_width=40)
+    _set_column_widths(ws, headers, rows, max_width=40)
     return header_row, data_end_row
 
 
@@ -368,6 +465,9 @@ def _add_bar_chart(
     if data_end_row < data_start_row:
         return
 
+    from openpyxl.chart import BarChart, Reference
+    from openpyxl.chart.label import DataLabelList
+
     chart = BarChart()
     chart.type = "col"
     chart.style = 10
@@ -399,26 +499,20 @@ def _write_chart_notes(ws, start_row: int, title: str, lines: list[str]):
         row += 1
 
 
-def _build_executive_variable_rows(grouped, variables, columns_meta):
+def _build_executive_variable_rows(ranked, variables, columns_meta):
     """Executive summary rows with best/worst/variability leaders per variable."""
     rows = []
-    if not grouped:
-        return rows
+    labels = _variable_labels(variables, columns_meta)
 
     for var in variables:
-        var_name = columns_meta.get(var, var)
-        entries = []
-        for group_key, group_stats in grouped.items():
-            stat = next((s for s in group_stats if s.col_key == var), None)
-            if not stat or stat.mean is None:
-                continue
-            entries.append((group_key, stat))
-
+        var_name = labels[var]
+        entries = ranked.get(var, [])
         if not entries:
             continue
 
-        best = max(entries, key=lambda x: _safe_val(x[1].mean))
-        worst = min(entries, key=lambda x: _safe_val(x[1].mean))
+        # Entries are already sorted by mean (desc).
+        best = entries[0]
+        worst = entries[-1]
         highest_std = max(entries, key=lambda x: _safe_val(x[1].std))
         highest_cv = max(entries, key=lambda x: _safe_val(x[1].cv))
         largest_n = max(entries, key=lambda x: _safe_val(x[1].count, default=0))
@@ -453,8 +547,9 @@ def _build_executive_narrative_rows(
     for test in tests or []:
         test_by_variable[test.variable] = test
 
+    labels = _variable_labels(variables, columns_meta)
     for variable in variables:
-        variable_name = columns_meta.get(variable, variable)
+        variable_name = labels[variable]
         values = _get_primary_variable_rows(grouped, variable)
         values = [v for v in values if v["mean"] is not None]
         if not values:
@@ -538,7 +633,7 @@ def _write_narrative_sheet(ws, grouped, variables, columns_meta, tests):
 
     if not grouped:
         ws.cell(row=9, column=1, value="Nao ha agrupamento ativo. Ative 'Agrupar por' para gerar narrativas comparativas.").font = CELL_FONT
-        _auto_width(ws, max_width=48)
+        ws.column_dimensions["A"].width = 48
         return
 
     rows = _build_executive_narrative_rows(grouped, variables, columns_meta, tests)
@@ -627,7 +722,7 @@ def _write_dashboard_sheet(
 
     if not grouped or not variables:
         ws.cell(row=8, column=1, value="Nao ha dados agrupados para montar o dashboard.").font = CELL_FONT
-        _auto_width(ws, max_width=40)
+        ws.column_dimensions["A"].width = 40
         return
 
     primary_variable = variables[0]
@@ -636,7 +731,7 @@ def _write_dashboard_sheet(
     mean_rows = [r for r in base_rows if r["mean"] is not None]
     if not mean_rows:
         ws.cell(row=8, column=1, value="Nao ha medias validas para o agrupamento selecionado.").font = CELL_FONT
-        _auto_width(ws, max_width=40)
+        ws.column_dimensions["A"].width = 40
         return
 
     ws.cell(row=7, column=1, value=f"Variavel de referencia dos graficos: {primary_name}").font = Font(
@@ -766,8 +861,9 @@ def _write_dashboard_sheet(
     # Section 4: spread by variable (when multiple variables selected)
     if len(variables) > 1:
         spread_rows = []
+        labels = _variable_labels(variables, columns_meta)
         for variable in variables:
-            variable_name = columns_meta.get(variable, variable)
+            variable_name = labels[variable]
             var_rows = _get_primary_variable_rows(grouped, variable)
             var_rows = [r for r in var_rows if r["mean"] is not None]
             if not var_rows:
@@ -816,8 +912,6 @@ def _write_dashboard_sheet(
                 ],
             )
 
-    _auto_width(ws, max_width=42)
-
 
 def _write_executive_sheet(
     ws,
@@ -826,6 +920,7 @@ def _write_executive_sheet(
     variables: list[str],
     columns_meta: dict[str, str],
     grouped,
+    ranked,
     group_by: Optional[list[str]],
     filters: Optional[list[FilterCondition]],
     tests,
@@ -837,7 +932,7 @@ def _write_executive_sheet(
     ws.cell(row=7, column=1, value="Relatorio Executivo - Estatisticas por Grupo").font = Font(
         name="Calibri", bold=True, size=16, color="A0D0FF"
     )
-    ws.cell(row=8, column=1, value=f"Gerado em: {pd.Timestamp.now().strftime('%d/%m/%Y %H:%M:%S')}").font = Font(
+    ws.cell(row=8, column=1, value=f"Gerado em: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}").font = Font(
         name="Calibri", size=10, color="8BA3C0"
     )
 
@@ -845,7 +940,7 @@ def _write_executive_sheet(
     summary_rows = [
         ["Amostra total", sample_size],
         ["Total de grupos", total_groups if total_groups is not None else "-"],
-        ["Variaveis analisadas", ", ".join(columns_meta.get(v, v) for v in variables) if variables else "-"],
+        ["Variaveis analisadas", ", ".join(_variable_labels(variables, columns_meta).values()) if variables else "-"],
         ["Agrupamento ativo", ", ".join(columns_meta.get(g, g) for g in group_by) if group_by else "Sem agrupamento"],
         ["Filtros ativos", _format_filter_summary(filters, columns_meta)],
         ["Testes comparativos", "Ativos" if tests else "Nao disponivel"],
@@ -864,7 +959,7 @@ def _write_executive_sheet(
             "Maior N (Grupo)", "N",
             "Grupos com dado",
         ]
-        exec_rows = _build_executive_variable_rows(grouped, variables, columns_meta)
+        exec_rows = _build_executive_variable_rows(ranked, variables, columns_meta)
         if exec_rows:
             next_row = _write_simple_table(ws, exec_headers, exec_rows, start_row=19)
         else:
@@ -879,7 +974,83 @@ def _write_executive_sheet(
             simple_rows = [[row[0], row[1], row[5], row[6]] for row in narrative_rows]
             _write_simple_table(ws, headers, simple_rows, start_row=next_row + 2)
 
-    _auto_width(ws, max_width=42)
+
+def _create_excel_export_xlsxwriter(
+    sample_size: int,
+    stats,
+    grouped,
+    summaries,
+    tests,
+    ranked,
+    variables: list[str],
+    columns_meta: dict[str, str],
+    include_sheets: list[str],
+) -> io.BytesIO:
+    """
+    XlsxWriter fast path for the tabular sheets. XlsxWriter streams rows and
+    shares cell formats, which is markedly faster than openpyxl on large
+    group_report / matrix workloads.
+    """
+    import xlsxwriter
+
+    buffer = io.BytesIO()
+    wb = xlsxwriter.Workbook(buffer, {"in_memory": True})
+    header_fmt = wb.add_format({
+        "font_name": "Calibri", "font_size": 11, "bold": True,
+        "font_color": "#A0D0FF", "bg_color": "#1B2A4A", "align": "center",
+        "bottom": 1, "bottom_color": "#2A3F5F",
+    })
+    body_fmt = wb.add_format({
+        "font_name": "Calibri", "font_size": 10, "font_color": "#E8F0F9",
+        "bottom": 1, "bottom_color": "#2A3F5F",
+    })
+    title_fmt = wb.add_format({
+        "font_name": "Calibri", "font_size": 12, "bold": True, "font_color": "#A0D0FF",
+    })
+
+    def _write_table(ws, headers, rows, start_row=0):
+        ws.write_row(start_row, 0, headers, header_fmt)
+        for offset, row_values in enumerate(rows, 1):
+            ws.write_row(start_row + offset, 0, row_values, body_fmt)
+        return start_row + len(rows) + 1
+
+    if "descriptive" in include_sheets:
+        ws = wb.add_worksheet("Estatisticas Gerais")
+        ws.write(0, 0, f"Amostra: {sample_size} registros", title_fmt)
+        _write_table(ws, STATS_HEADERS, [_stat_row(s) for s in stats], start_row=2)
+
+    if "grouped" in include_sheets and grouped:
+        ws = wb.add_worksheet("Por Grupo")
+        rows = [
+            [group_key, *_stat_row(stat)]
+            for group_key, group_stats in grouped.items()
+            for stat in group_stats
+        ]
+        _write_table(ws, ["Grupo"] + STATS_HEADERS, rows)
+
+    if "group_report" in include_sheets and grouped:
+        ws = wb.add_worksheet("Resumo Grupo")
+        _write_table(ws, GROUP_REPORT_HEADERS, _build_group_report_rows(grouped, summaries))
+
+    if "group_matrix" in include_sheets and grouped:
+        ws = wb.add_worksheet("Matriz Grupo")
+        headers, rows = _build_group_matrix_table(grouped, variables, columns_meta, summaries)
+        _write_table(ws, headers, rows)
+
+    if "group_ranking" in include_sheets and grouped:
+        ws = wb.add_worksheet("Ranking Medias")
+        _write_table(ws, RANKING_HEADERS, _build_group_ranking_rows(ranked, variables, columns_meta))
+
+    if "comparison" in include_sheets and tests:
+        ws = wb.add_worksheet("Testes Comparativos")
+        _write_table(ws, COMPARISON_HEADERS, _comparison_rows(tests))
+
+    if not wb.worksheets():
+        wb.add_worksheet("Sheet")
+
+    wb.close()
+    buffer.seek(0)
+    return buffer
 
 
 def create_excel_export(
@@ -890,8 +1061,15 @@ def create_excel_export(
     group_by: Optional[list[str]] = None,
     treat_missing_as_zero: bool = True,
     include_sheets: list[str] = None,
+    engine: Literal["openpyxl", "xlsxwriter"] = "openpyxl",
 ) -> io.BytesIO:
-    """Create Excel workbook with statistics."""
+    """
+    Create Excel workbook with statistics.
+
+    The xlsxwriter engine is a faster streaming path for the tabular sheets;
+    executive sheets need openpyxl charts/images, so requesting them falls
+    back to the openpyxl engine.
+    """
     if include_sheets is None:
         include_sheets = ["descriptive"]
 
@@ -902,17 +1080,24 @@ def create_excel_export(
         run_comparison_tests=True if group_by else False,
     )
 
-    wb = Workbook()
-    active_taken = False
+    ranked = _rank_entries_by_variable(grouped, variables) if grouped else {}
+
+    if engine == "xlsxwriter" and "executive" not in include_sheets:
+        return _create_excel_export_xlsxwriter(
+            sample_size=sample_size,
+            stats=stats,
+            grouped=grouped,
+            summaries=summaries,
+            tests=tests,
+            ranked=ranked,
+            variables=variables,
+            columns_meta=columns_meta,
+            include_sheets=include_sheets,
+        )
 
-    def _sheet(title: str):
-        nonlocal active_taken
-        if not active_taken:
-            ws_local = wb.active
-            ws_local.title = title
-            active_taken = True
-            return ws_local
-        return wb.create_sheet(title)
+    wb = Workbook()
+    wb.remove(wb.active)
+    _sheet = wb.create_sheet
 
     # Sheet 1: Executive report
     if "executive" in include_sheets:
@@ -924,6 +1109,7 @@ def create_excel_export(
             variables=variables,
             columns_meta=columns_meta,
             grouped=grouped,
+            ranked=ranked,
             group_by=group_by,
             filters=filters,
             tests=tests,
@@ -957,28 +1143,21 @@ def create_excel_export(
         )
         _write_stats_table(ws, stats, start_row=8)
 
-    # Sheet 3: Grouped stats
+    # Sheet 3: Grouped stats (single flat table; one header/style/width pass)
     if "grouped" in include_sheets and grouped:
         ws = _sheet("Por Grupo")
-        current_row = 1
-        for group_key, group_stats in grouped.items():
-            ws.cell(row=current_row, column=1, value=f"Grupo: {group_key}").font = Font(bold=True, size=11, color="22D3EE")
-            current_row = _write_stats_table(ws, group_stats, start_row=current_row + 1)
-            current_row += 1
+        rows = [
+            [group_key, *_stat_row(stat)]
+            for group_key, group_stats in grouped.items()
+            for stat in group_stats
+        ]
+        _write_simple_table(ws, ["Grupo"] + STATS_HEADERS, rows, start_row=1)
 
     # Sheet 4: Group report (one row per group x variable)
     if "group_report" in include_sheets and grouped:
         ws = _sheet("Resumo Grupo")
-        headers = [
-            "Grupo", "N Grupo", "% Total",
-            "Variavel", "N", "Ausentes", "% Ausentes",
-            "Media", "Mediana", "Moda", "DP", "Variancia", "CV%", "SEM",
-            "Min", "Max", "Amplitude", "Q1", "Q3", "IQR",
-            "P5", "P10", "P90", "P95", "Assimetria", "Curtose",
-            "IC Inf", "IC Sup", "Soma"
-        ]
         rows = _build_group_report_rows(grouped, summaries)
-        _write_simple_table(ws, headers, rows, start_row=1)
+        _write_simple_table(ws, GROUP_REPORT_HEADERS, rows, start_row=1)
 
     # Sheet 5: Group matrix (compact comparative view)
     if "group_matrix" in include_sheets and grouped:
@@ -989,47 +1168,20 @@ def create_excel_export(
     # Sheet 6: Mean rankings by variable
     if "group_ranking" in include_sheets and grouped:
         ws = _sheet("Ranking Medias")
-        headers = [
-            "Variavel", "Ranking", "Grupo",
-            "Media", "DP", "CV%", "Mediana",
-            "Min", "Max", "Amplitude", "N", "IC Inf", "IC Sup"
-        ]
-        rows = _build_group_ranking_rows(grouped, variables, columns_meta)
-        _write_simple_table(ws, headers, rows, start_row=1)
+        rows = _build_group_ranking_rows(ranked, variables, columns_meta)
+        _write_simple_table(ws, RANKING_HEADERS, rows, start_row=1)
 
     # Sheet 7: Comparison tests
     if "comparison" in include_sheets and tests:
         ws = _sheet("Testes Comparativos")
-        headers = [
-            "Variavel",
-            "Teste",
-            "Estatistica",
-            "p-valor",
-            "Significativo",
-            "Tamanho Efeito",
-            "Interpretacao",
-            "Explicacao Pratica",
-        ]
-        for col_idx, h in enumerate(headers, 1):
+        for col_idx, h in enumerate(COMPARISON_HEADERS, 1):
             ws.cell(row=1, column=col_idx, value=h)
-        _style_header(ws, 1, len(headers))
-
-        for row_idx, test in enumerate(tests, 2):
-            values = [
-                test.variable_name, test.test_name_display,
-                test.statistic, test.p_value,
-                "Sim" if test.significant else "Nao",
-                f"{test.effect_size_name} = {test.effect_size}" if test.effect_size is not None else "-",
-                test.interpretation,
-                test.practical_explanation or "-",
-            ]
-            for col_idx, v in enumerate(values, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=v)
-                cell.font = CELL_FONT
-
-    # Remove default empty sheet if we created named ones
-    if wb.sheetnames[0] == "Sheet" and len(wb.sheetnames) > 1:
-        del wb["Sheet"]
+        _style_header(ws, 1, len(COMPARISON_HEADERS))
+        _append_styled_rows(ws, _comparison_rows(tests), start_row=1)
+
+    # A workbook cannot be saved without at least one sheet.
+    if not wb.sheetnames:
+        _sheet("Sheet")
 
     buffer = io.BytesIO()
     wb.save(buffer)
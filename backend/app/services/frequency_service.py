@@ -2,11 +2,38 @@
 Orion Analytics - Frequency Service
 Calculates frequency tables for categorical/discrete variables.
 """
+import numpy as np
 import pandas as pd
 from typing import Optional
 
 from app.schemas.schemas import FilterCondition, FrequencyRow, FrequencyResponse
-from app.services.data_service import apply_filters
+from app.services.data_service import apply_filters_mask
+
+
+def _numeric_top_counts(series: pd.Series, max_categories: int, include_missing: bool):
+    """
+    Top-K value counts for numeric columns via np.unique + partition-select,
+    which is O(U) instead of value_counts' full O(U log U) sort over uniques.
+    """
+    arr = series.to_numpy()
+    n_missing = 0
+    if arr.dtype.kind == "f":
+        nan_mask = np.isnan(arr)
+        n_missing = int(nan_mask.sum())
+        if n_missing:
+            arr = arr[~nan_mask]
+
+    values, counts = np.unique(arr, return_counts=True)
+    if include_missing and n_missing:
+        values = np.append(values.astype(object), "(ausente)")
+        counts = np.append(counts, n_missing)
+
+    if len(counts) > max_categories:
+        keep = np.argpartition(counts, -max_categories)[-max_categories:]
+        values, counts = values[keep], counts[keep]
+
+    order = np.argsort(-counts, kind="stable")
+    return values[order], counts[order]
 
 
 def calculate_frequencies(
@@ -18,38 +45,47 @@ def calculate_frequencies(
     treat_missing_as_zero: bool = True,
 ) -> FrequencyResponse:
     """Calculate frequency tables for selected variables."""
-    if filters:
-        df = apply_filters(df, filters)
-
-    sample_size = len(df)
+    mask = apply_filters_mask(df, filters) if filters else None
+    sample_size = int(mask.sum()) if mask is not None else len(df.index)
     tables = {}
 
     for var in variables:
         if var not in df.columns:
             continue
 
-        series = df[var].copy()
-        if treat_missing_as_zero:
-            series = series.fillna("(ausente)")
+        series = df[var]
+        if mask is not None:
+            series = series[mask]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iufb":
+            index, counts_arr = _numeric_top_counts(series, max_categories, treat_missing_as_zero)
+        else:
+            if treat_missing_as_zero:
+                counts = series.value_counts(dropna=False)
+                if counts.index.hasnans:
+                    counts.index = counts.index.fillna("(ausente)")
+            else:
+                counts = series.value_counts()
+            counts = counts.head(max_categories)
+            index, counts_arr = counts.index, counts.to_numpy()
+
+        total = int(counts_arr.sum())
+        cumulative = counts_arr.cumsum()
+        if total > 0:
+            pct = np.round(counts_arr / total * 100, 2)
+            cum_pct = np.round(cumulative / total * 100, 2)
         else:
-            series = series.dropna()
-
-        counts = series.value_counts().head(max_categories)
-        total = counts.sum()
-
-        rows = []
-        cumulative = 0
-        for value, count in counts.items():
-            cumulative += count
-            pct = round(count / total * 100, 2) if total > 0 else 0
-            cum_pct = round(cumulative / total * 100, 2) if total > 0 else 0
-            rows.append(FrequencyRow(
+            pct = cum_pct = np.zeros(len(counts_arr))
+
+        rows = [
+            FrequencyRow(
                 value=str(value),
                 count=int(count),
-                percentage=pct,
-                cumulative_count=int(cumulative),
-                cumulative_pct=cum_pct,
-            ))
+                percentage=float(p),
+                cumulative_count=int(cum),
+                cumulative_pct=float(cp),
+            )
+            for value, count, p, cum, cp in zip(index, counts_arr, pct, cumulative, cum_pct)
+        ]
 
         col_name = columns_meta.get(var, var)
         tables[col_name] = rows
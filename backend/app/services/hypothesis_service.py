@@ -46,20 +46,24 @@ def run_hypothesis_test(
         if test_value is None:
             raise ValueError("test_value is required for one-sample t-test")
 
-        stat, p = scipy_stats.ttest_1samp(series.values, test_value)
-        effect = abs(series.mean() - test_value) / series.std() if series.std() > 0 else 0
+        arr = series.to_numpy(dtype=np.float64)
+        mean = float(arr.mean())
+        std = float(arr.std(ddof=1))
+
+        stat, p = scipy_stats.ttest_1samp(arr, test_value)
+        effect = abs(mean - test_value) / std if std > 0 else 0
         effect_name = "d de Cohen"
         effect_interp = _effect_size_label(effect, "d")
 
         decision = "Rejeitar H0" if p < alpha else "Nao rejeitar H0"
         p_str = "p < 0.001" if p < 0.001 else f"p = {p:.4f}"
         interp = (
-            f"Teste t para uma amostra: a media de {var_name} ({series.mean():.2f}) "
+            f"Teste t para uma amostra: a media de {var_name} ({mean:.2f}) "
             f"{'difere' if p < alpha else 'nao difere'} significativamente de {test_value} "
             f"(t = {stat:.2f}, {p_str})."
         )
 
-        sem = series.std() / math.sqrt(n)
+        sem = std / math.sqrt(n)
         t_crit = scipy_stats.t.ppf(0.975, df=n - 1)
 
         return HypothesisTestResponse(
@@ -71,8 +75,8 @@ def run_hypothesis_test(
             effect_size=round(effect, 4),
             effect_size_name=effect_name,
             effect_size_interpretation=effect_interp,
-            ci_lower=round(series.mean() - t_crit * sem, 4),
-            ci_upper=round(series.mean() + t_crit * sem, 4),
+            ci_lower=round(mean - t_crit * sem, 4),
+            ci_upper=round(mean + t_crit * sem, 4),
             decision=decision,
             interpretation=interp,
         )
@@ -81,32 +85,36 @@ def run_hypothesis_test(
         if not group_variable or group_variable not in df.columns:
             raise ValueError("group_variable is required")
 
-        groups = df.groupby(group_variable)
-        group_keys = list(groups.groups.keys())
+        # Boolean masks on the factorized group column: no groupby hash index
+        # and no per-group DataFrame materialization.
+        codes, group_keys = pd.factorize(df[group_variable], sort=True)
         if len(group_keys) < 2:
             raise ValueError("Need at least 2 groups")
 
-        g1 = pd.to_numeric(groups.get_group(group_keys[0])[variable], errors='coerce')
-        g2 = pd.to_numeric(groups.get_group(group_keys[1])[variable], errors='coerce')
+        vals = pd.to_numeric(df[variable], errors='coerce').to_numpy(dtype=np.float64, copy=True)
+        g1, g2 = vals[codes == 0], vals[codes == 1]
         if treat_missing_as_zero:
-            g1, g2 = g1.fillna(0), g2.fillna(0)
+            g1 = np.nan_to_num(g1, copy=False)
+            g2 = np.nan_to_num(g2, copy=False)
         else:
-            g1, g2 = g1.dropna(), g2.dropna()
+            g1, g2 = g1[~np.isnan(g1)], g2[~np.isnan(g2)]
 
+        mean1, mean2 = float(g1.mean()), float(g2.mean())
+        var1, var2 = float(g1.var(ddof=1)), float(g2.var(ddof=1))
         summary = [
-            {"grupo": str(group_keys[0]), "n": len(g1), "media": round(float(g1.mean()), 4), "dp": round(float(g1.std()), 4)},
-            {"grupo": str(group_keys[1]), "n": len(g2), "media": round(float(g2.mean()), 4), "dp": round(float(g2.std()), 4)},
+            {"grupo": str(group_keys[0]), "n": len(g1), "media": round(mean1, 4), "dp": round(math.sqrt(var1), 4)},
+            {"grupo": str(group_keys[1]), "n": len(g2), "media": round(mean2, 4), "dp": round(math.sqrt(var2), 4)},
         ]
 
         if test_type == "independent_t":
-            stat, p = scipy_stats.ttest_ind(g1.values, g2.values, equal_var=False)
+            stat, p = scipy_stats.ttest_ind(g1, g2, equal_var=False)
             test_name = "Teste t independente (Welch)"
         else:
-            stat, p = scipy_stats.mannwhitneyu(g1.values, g2.values, alternative=alt)
+            stat, p = scipy_stats.mannwhitneyu(g1, g2, alternative=alt)
             test_name = "Mann-Whitney U"
 
-        pooled_std = math.sqrt((g1.var() + g2.var()) / 2)
-        effect = abs(g1.mean() - g2.mean()) / pooled_std if pooled_std > 0 else 0
+        pooled_std = math.sqrt((var1 + var2) / 2)
+        effect = abs(mean1 - mean2) / pooled_std if pooled_std > 0 else 0
 
         decision = "Rejeitar H0" if p < alpha else "Nao rejeitar H0"
         p_str = "p < 0.001" if p < 0.001 else f"p = {p:.4f}"
@@ -129,14 +137,15 @@ def run_hypothesis_test(
         if not paired_variable or paired_variable not in df.columns:
             raise ValueError("paired_variable is required")
 
-        s1 = pd.to_numeric(df[variable], errors='coerce')
-        s2 = pd.to_numeric(df[paired_variable], errors='coerce')
-        mask = s1.notna() & s2.notna()
+        s1 = pd.to_numeric(df[variable], errors='coerce').to_numpy(dtype=np.float64)
+        s2 = pd.to_numeric(df[paired_variable], errors='coerce').to_numpy(dtype=np.float64)
+        mask = ~(np.isnan(s1) | np.isnan(s2))
         s1, s2 = s1[mask], s2[mask]
 
-        stat, p = scipy_stats.ttest_rel(s1.values, s2.values)
+        stat, p = scipy_stats.ttest_rel(s1, s2)
         diff = s1 - s2
-        effect = abs(diff.mean()) / diff.std() if diff.std() > 0 else 0
+        diff_std = float(diff.std(ddof=1))
+        effect = abs(float(diff.mean())) / diff_std if diff_std > 0 else 0
 
         decision = "Rejeitar H0" if p < alpha else "Nao rejeitar H0"
         p_str = "p < 0.001" if p < 0.001 else f"p = {p:.4f}"
@@ -159,36 +168,64 @@ def run_hypothesis_test(
         if not group_variable or group_variable not in df.columns:
             raise ValueError("group_variable is required")
 
-        groups = df.groupby(group_variable)
-        group_data = []
-        summary = []
-        for key, gdf in groups:
-            g = pd.to_numeric(gdf[variable], errors='coerce')
-            if treat_missing_as_zero:
-                g = g.fillna(0)
-            else:
-                g = g.dropna()
-            if len(g) >= 2:
-                group_data.append(g.values)
-                summary.append({"grupo": str(key), "n": len(g), "media": round(float(g.mean()), 4), "dp": round(float(g.std()), 4)})
-
-        if len(group_data) < 2:
+        # Single vectorized pass: factorize the group labels once and derive
+        # per-group n/mean/std from bincount sums instead of looping group
+        # DataFrames through pandas.
+        codes, uniques = pd.factorize(df[group_variable], sort=True)
+        vals = pd.to_numeric(df[variable], errors='coerce').to_numpy(dtype=np.float64, copy=True)
+
+        valid = codes >= 0  # factorize marks NaN group keys with -1
+        if treat_missing_as_zero:
+            vals = np.nan_to_num(vals, copy=False)
+        else:
+            valid &= ~np.isnan(vals)
+        codes, vals = codes[valid], vals[valid]
+
+        n_labels = len(uniques)
+        counts = np.bincount(codes, minlength=n_labels)
+        sums = np.bincount(codes, weights=vals, minlength=n_labels)
+        sqsums = np.bincount(codes, weights=vals * vals, minlength=n_labels)
+
+        keep = counts >= 2
+        if int(keep.sum()) < 2:
             raise ValueError("Need at least 2 groups with data")
 
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+            variances = np.where(
+                counts > 1,
+                (sqsums - np.maximum(counts, 1) * means ** 2) / np.maximum(counts - 1, 1),
+                np.nan,
+            )
+        stds = np.sqrt(np.maximum(variances, 0))
+
+        # Per-group arrays (only needed for the scipy call itself).
+        order = np.argsort(codes, kind="stable")
+        group_arrays = np.split(vals[order], np.cumsum(counts)[:-1])
+        group_data = [ga for ga, k in zip(group_arrays, keep) if k]
+
+        summary = [
+            {"grupo": str(key), "n": int(counts[i]), "media": round(float(means[i]), 4), "dp": round(float(stds[i]), 4)}
+            for i, key in enumerate(uniques)
+            if keep[i]
+        ]
+
+        kept_n = int(counts[keep].sum())
+        kept_sum = float(sums[keep].sum())
+        gm = kept_sum / kept_n
+
         if test_type == "one_way_anova":
             stat, p = scipy_stats.f_oneway(*group_data)
             test_name = "ANOVA one-way"
-            all_data = np.concatenate(group_data)
-            gm = np.mean(all_data)
-            ss_b = sum(len(gd) * (np.mean(gd) - gm) ** 2 for gd in group_data)
-            ss_t = np.sum((all_data - gm) ** 2)
+            ss_b = float((counts[keep] * (means[keep] - gm) ** 2).sum())
+            ss_t = float(sqsums[keep].sum()) - 2 * gm * kept_sum + kept_n * gm ** 2
             effect = ss_b / ss_t if ss_t > 0 else 0
             effect_name = "eta²"
             effect_interp = _effect_size_label(effect, "eta")
         else:
             stat, p = scipy_stats.kruskal(*group_data)
             test_name = "Kruskal-Wallis"
-            N = sum(len(gd) for gd in group_data)
+            N = kept_n
             effect = (stat - len(group_data) + 1) / (N - len(group_data)) if N > len(group_data) else 0
             effect_name = "epsilon²"
             effect_interp = _effect_size_label(effect, "eta")
@@ -213,12 +250,12 @@ def run_hypothesis_test(
         if not paired_variable or paired_variable not in df.columns:
             raise ValueError("paired_variable is required")
 
-        s1 = pd.to_numeric(df[variable], errors='coerce')
-        s2 = pd.to_numeric(df[paired_variable], errors='coerce')
-        mask = s1.notna() & s2.notna()
+        s1 = pd.to_numeric(df[variable], errors='coerce').to_numpy(dtype=np.float64)
+        s2 = pd.to_numeric(df[paired_variable], errors='coerce').to_numpy(dtype=np.float64)
+        mask = ~(np.isnan(s1) | np.isnan(s2))
         s1, s2 = s1[mask], s2[mask]
 
-        stat, p = scipy_stats.wilcoxon(s1.values, s2.values, alternative=alt)
+        stat, p = scipy_stats.wilcoxon(s1, s2, alternative=alt)
 
         decision = "Rejeitar H0" if p < alpha else "Nao rejeitar H0"
         p_str = "p < 0.001" if p < 0.001 else f"p = {p:.4f}"
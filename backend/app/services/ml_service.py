@@ -9,8 +9,10 @@ MODEL REGISTRY (CONFIDENTIAL - Not exposed in API):
 - "Machine Learning - Delta" -> ElasticNet
 - "Machine Learning - Nova"  -> SVR (RBF kernel)
 """
+import os
 import uuid
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -18,8 +20,8 @@ import numpy as np
 import pandas as pd
 import joblib
 
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
+from sklearn.base import clone
+from sklearn.preprocessing import StandardScaler, OneHotEncoder, OrdinalEncoder
 from sklearn.impute import SimpleImputer
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
@@ -30,8 +32,9 @@ from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, H
 from sklearn.linear_model import ElasticNet
 from sklearn.svm import SVR
 
-# Linear Regression with statsmodels for coefficients
-import statsmodels.api as sm
+# t-distribution and Cholesky solver for linear-regression coefficients
+from scipy import stats
+from scipy.linalg import cho_factor, cho_solve
 
 from app.core.config import settings
 from app.schemas.schemas import (
@@ -47,10 +50,12 @@ from app.services.data_service import apply_filters
 # ============================================================================
 MODEL_REGISTRY = {
     "Machine Learning - Pro": RandomForestRegressor(
-        n_estimators=100, 
-        max_depth=10, 
+        n_estimators=100,
+        max_depth=10,
         random_state=42,
-        n_jobs=-1
+        # Registry models train concurrently; keep the forest single-threaded
+        # so it does not oversubscribe the cores the other fits are using.
+        n_jobs=1
     ),
     "Machine Learning - Alpha": GradientBoostingRegressor(
         n_estimators=100,
@@ -77,13 +82,70 @@ MODEL_REGISTRY = {
     )
 }
 
+# Tree-based models are scale-invariant, so they skip StandardScaler and use
+# compact ordinal codes for categoricals instead of a wide dense one-hot matrix.
+TREE_MODELS = frozenset({
+    "Machine Learning - Pro",
+    "Machine Learning - Alpha",
+    "Machine Learning - Sigma",
+})
+
+# HistGradientBoosting bins categorical codes; codes must fit under max_bins.
+_HGBT_MAX_CATEGORIES = 255
+
+# RBF-SVR training is O(n^2)+; cap its training slice so Nova stays bounded
+# on large datasets. Evaluation still uses the full test set.
+_SVR_MAX_TRAIN_ROWS = 5000
+
+
+def _fit_one(
+    label: str,
+    model: Any,
+    Xtr: np.ndarray,
+    y_train: np.ndarray,
+    Xte: np.ndarray,
+    y_test: np.ndarray
+) -> Optional[dict]:
+    """Fit a single registry model and score it on the held-out split."""
+    try:
+        model.fit(Xtr, y_train)
+        y_pred = model.predict(Xte)
+
+        r2 = round(float(r2_score(y_test, y_pred)), 4)
+        rmse = round(float(np.sqrt(mean_squared_error(y_test, y_pred))), 4)
+        mae = round(float(mean_absolute_error(y_test, y_pred)), 4)
+        mape = _calculate_mape(y_test, y_pred)
+        if mape is not None:
+            mape = round(mape, 2)
+
+        return {
+            'label': label,
+            'r2': r2,
+            'rmse': rmse,
+            'mae': mae,
+            'mape': mape,
+            'model': model
+        }
+
+    except Exception as e:
+        # Model failed, skip
+        print(f"Model {label} failed: {e}")
+        return None
+
 
 def _calculate_mape(y_true: np.ndarray, y_pred: np.ndarray) -> Optional[float]:
     """Calculate Mean Absolute Percentage Error, handling zeros."""
     mask = y_true != 0
-    if mask.sum() == 0:
+    n_valid = int(np.count_nonzero(mask))
+    if n_valid == 0:
         return None
-    return float(np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask])) * 100)
+
+    # Relative errors in a single buffer: zero-target rows stay 0 via `where`,
+    # so no fancy-indexed copies of y_true/y_pred are materialized
+    errors = np.zeros(len(y_true), dtype=np.float64)
+    np.divide(y_true - y_pred, y_true, out=errors, where=mask)
+    np.abs(errors, out=errors)
+    return float(errors.sum() / n_valid * 100)
 
 
 def prepare_features(
@@ -99,32 +161,36 @@ def prepare_features(
         (X_df, numeric_cols, categorical_cols, categorical_values)
     """
     X = df[feature_cols].copy()
-    
-    # Separate numeric and categorical columns based on metadata
-    numeric_cols = []
-    categorical_cols = []
-    categorical_values = {}
-    
-    for col in feature_cols:
-        meta = columns_meta.get(col, {})
-        var_type = meta.get('var_type', 'continuous')
-        
-        if var_type == 'categorical':
-            categorical_cols.append(col)
-            # Store unique values for simulation form
-            categorical_values[col] = X[col].dropna().unique().tolist()
-        else:
-            # Treat discrete and continuous as numeric
-            numeric_cols.append(col)
-            X[col] = pd.to_numeric(X[col], errors='coerce')
-    
-    # Handle missing values
+
+    # Separate numeric and categorical columns based on metadata;
+    # discrete and continuous both count as numeric
+    categorical_cols = [
+        col for col in feature_cols
+        if columns_meta.get(col, {}).get('var_type', 'continuous') == 'categorical'
+    ]
+    numeric_cols = [col for col in feature_cols if col not in categorical_cols]
+
+    if numeric_cols:
+        # Fast-path precision for the ML models only: float32 halves the bytes
+        # moved during fit/predict. train_linear_regression re-casts to
+        # float64 before solving, so the reported coefficients keep full
+        # statistical precision.
+        X[numeric_cols] = (
+            X[numeric_cols].apply(pd.to_numeric, errors='coerce').astype(np.float32)
+        )
+
+    # Store unique values for simulation form (before any missing fill)
+    categorical_values = {
+        col: X[col].dropna().unique().tolist() for col in categorical_cols
+    }
+
+    # Handle missing values block-wise instead of per column
     if treat_missing_as_zero:
-        for col in numeric_cols:
-            X[col] = X[col].fillna(0)
-        for col in categorical_cols:
-            X[col] = X[col].fillna('MISSING')
-    
+        if numeric_cols:
+            X[numeric_cols] = X[numeric_cols].fillna(0)
+        if categorical_cols:
+            X[categorical_cols] = X[categorical_cols].fillna('MISSING')
+
     return X, numeric_cols, categorical_cols, categorical_values
 
 
@@ -144,12 +210,45 @@ def build_preprocessor(
         transformers.append(('num', numeric_transformer, numeric_cols))
     
     if categorical_cols:
+        # Sparse one-hot output: the consumers of this preprocessor
+        # (ElasticNet, SVR) both accept CSR input natively, so wide
+        # categoricals never materialize as a dense matrix
         categorical_transformer = Pipeline([
             ('imputer', SimpleImputer(strategy='constant', fill_value='MISSING')),
-            ('encoder', OneHotEncoder(handle_unknown='ignore', sparse_output=False))
+            ('encoder', OneHotEncoder(handle_unknown='ignore', sparse_output=True))
         ])
         transformers.append(('cat', categorical_transformer, categorical_cols))
-    
+
+    return ColumnTransformer(transformers=transformers)
+
+
+def build_tree_preprocessor(
+    numeric_cols: list[str],
+    categorical_cols: list[str],
+    missing_code: int | float = -1
+) -> ColumnTransformer:
+    """
+    Build preprocessing pipeline for tree-based models.
+    No scaling (trees are scale-invariant); categoricals become ordinal codes
+    with unknown/missing mapped to `missing_code` (-1 works as an ordinary
+    split value for RandomForest/GradientBoosting; pass NaN for HGBT's
+    native categorical support, which treats NaN as missing).
+    """
+    transformers = []
+
+    if numeric_cols:
+        transformers.append(
+            ('num', SimpleImputer(strategy='constant', fill_value=0), numeric_cols)
+        )
+
+    if categorical_cols:
+        categorical_transformer = OrdinalEncoder(
+            handle_unknown='use_encoded_value',
+            unknown_value=missing_code,
+            encoded_missing_value=missing_code
+        )
+        transformers.append(('cat', categorical_transformer, categorical_cols))
+
     return ColumnTransformer(transformers=transformers)
 
 
@@ -160,90 +259,94 @@ def train_linear_regression(
     columns_meta: dict[str, dict]
 ) -> LinearRegressionResult:
     """
-    Train OLS linear regression and extract coefficients using statsmodels.
+    Train OLS linear regression and extract coefficients via LAPACK
+    (Cholesky on the normal equations, least squares as fallback).
     """
     try:
-        # Prepare data - one-hot encode categorical
-        X_prepared = X.copy()
-        encoded_features = []
-        
-        for col in list(X_prepared.columns):
-            meta = columns_meta.get(col, {})
-            var_type = meta.get('var_type', 'continuous')
-            
-            if var_type == 'categorical':
-                # One-hot encode
-                dummies = pd.get_dummies(X_prepared[col], prefix=col, drop_first=True)
-                X_prepared = X_prepared.drop(columns=[col])
-                for dcol in dummies.columns:
-                    X_prepared[dcol] = dummies[dcol].astype(float)
-                    encoded_features.append(dcol)
-            else:
-                # Convert to numeric
-                X_prepared[col] = pd.to_numeric(X_prepared[col], errors='coerce')
-                encoded_features.append(col)
-        
-        # Fill NaN values with 0
-        X_prepared = X_prepared.fillna(0)
-        
-        # CRITICAL: Ensure all columns are float64 to avoid numpy casting errors
-        for col in X_prepared.columns:
-            X_prepared[col] = X_prepared[col].astype(np.float64)
-        
+        # Prepare data - one-hot encode categorical, whole blocks at a time
+        cat_cols = [
+            col for col in X.columns
+            if columns_meta.get(col, {}).get('var_type', 'continuous') == 'categorical'
+        ]
+        num_cols = [col for col in X.columns if col not in cat_cols]
+
+        parts = []
+        if num_cols:
+            parts.append(X[num_cols].apply(pd.to_numeric, errors='coerce'))
+        if cat_cols:
+            parts.append(pd.get_dummies(X[cat_cols], drop_first=True, dtype=np.float64))
+
+        # Fill NaN with 0 and cast everything to float64 in one pass
+        X_prepared = pd.concat(parts, axis=1).fillna(0).astype(np.float64)
+
         # Clean target variable
         y_clean = pd.to_numeric(y, errors='coerce').fillna(0).astype(np.float64)
-        
-        # Remove rows with any remaining invalid values
-        valid_mask = ~(X_prepared.isnull().any(axis=1) | np.isinf(X_prepared).any(axis=1))
-        valid_mask = valid_mask & ~(y_clean.isnull() | np.isinf(y_clean))
-        
+
+        # Remove rows with any remaining invalid values (only inf survives the fill)
+        valid_mask = (
+            np.isfinite(X_prepared.to_numpy()).all(axis=1)
+            & np.isfinite(y_clean.to_numpy())
+        )
+
         X_prepared = X_prepared[valid_mask]
         y_clean = y_clean[valid_mask]
         
         if len(X_prepared) < 5:
             raise ValueError("Not enough valid samples for linear regression")
-        
-        # Add constant for intercept
-        X_with_const = sm.add_constant(X_prepared, has_constant='add')
-        
-        # Ensure const column is also float64
-        if 'const' in X_with_const.columns:
-            X_with_const['const'] = X_with_const['const'].astype(np.float64)
-        
-        # Fit OLS model
-        model = sm.OLS(y_clean, X_with_const).fit()
-        
+
+        # Fit OLS directly via LAPACK least squares (constant column first)
+        feature_labels = list(X_prepared.columns)
+        X_arr = np.column_stack([np.ones(len(X_prepared)), X_prepared.to_numpy()])
+        y_arr = y_clean.to_numpy()
+        n_obs, n_params = X_arr.shape
+        dof = n_obs - n_params
+
+        # Solve the normal equations with one Cholesky factorization; the
+        # same factor then yields (X'X)^-1 for the standard errors. Falls
+        # back to lstsq + pinv when dummy columns make X'X singular.
+        xtx = X_arr.T @ X_arr
+        try:
+            factor = cho_factor(xtx)
+            beta = cho_solve(factor, X_arr.T @ y_arr)
+            xtx_inv_diag = np.diag(cho_solve(factor, np.eye(n_params)))
+        except np.linalg.LinAlgError:
+            beta, _, _, _ = np.linalg.lstsq(X_arr, y_arr, rcond=None)
+            xtx_inv_diag = np.diag(np.linalg.pinv(xtx))
+
+        resid = y_arr - X_arr @ beta
+        rss = float(resid @ resid)
+
+        if dof > 0:
+            sigma2 = rss / dof
+            se = np.sqrt(xtx_inv_diag * sigma2)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_vals = beta / se
+            p_vals = 2 * stats.t.sf(np.abs(t_vals), dof)
+        else:
+            se = t_vals = p_vals = np.full(n_params, np.nan)
+
         # Extract coefficients
         coefficients = []
-        for name in X_with_const.columns:
-            if name == 'const':
-                continue
-            
-            coef = model.params.get(name, 0)
-            std_err = model.bse.get(name, None)
-            t_val = model.tvalues.get(name, None)
-            p_val = model.pvalues.get(name, None)
-            
+        for i, name in enumerate(feature_labels, start=1):
+            coef = beta[i]
+            std_err = se[i]
+            t_val = t_vals[i]
+            p_val = p_vals[i]
+
             # Handle potential infinite or NaN values
             if not np.isfinite(coef):
                 coef = 0.0
-            if std_err is not None and not np.isfinite(std_err):
-                std_err = None
-            if t_val is not None and not np.isfinite(t_val):
-                t_val = None
-            if p_val is not None and not np.isfinite(p_val):
-                p_val = None
-            
+
             coefficients.append(LinearCoefficient(
                 feature=name,
                 coefficient=round(float(coef), 6),
-                std_error=round(float(std_err), 6) if std_err is not None else None,
-                t_value=round(float(t_val), 4) if t_val is not None else None,
-                p_value=round(float(p_val), 6) if p_val is not None else None
+                std_error=round(float(std_err), 6) if np.isfinite(std_err) else None,
+                t_value=round(float(t_val), 4) if np.isfinite(t_val) else None,
+                p_value=round(float(p_val), 6) if np.isfinite(p_val) else None
             ))
-        
+
         # Build equation string
-        intercept_val = model.params.get('const', 0)
+        intercept_val = beta[0]
         if not np.isfinite(intercept_val):
             intercept_val = 0.0
         intercept = round(float(intercept_val), 4)
@@ -259,9 +362,10 @@ def train_linear_regression(
         equation = f"y = {' '.join(equation_parts)}"
         
         # Calculate metrics
-        y_pred = model.predict(X_with_const)
-        r2 = round(float(model.rsquared), 4) if np.isfinite(model.rsquared) else 0.0
-        rmse = round(float(np.sqrt(mean_squared_error(y_clean, y_pred))), 4)
+        tss = float(((y_arr - y_arr.mean()) ** 2).sum())
+        r2_val = 1.0 - rss / tss if tss > 0 else 0.0
+        r2 = round(r2_val, 4) if np.isfinite(r2_val) else 0.0
+        rmse = round(float(np.sqrt(rss / n_obs)), 4)
         
         return LinearRegressionResult(
             equation=equation,
@@ -318,68 +422,106 @@ def train_models(
         X = X[mask]
         y = y[mask]
     
-    y = pd.to_numeric(y, errors='coerce').fillna(0)
-    
+    y = pd.to_numeric(y, errors='coerce').fillna(0).astype(np.float32)
+
     if len(X) < 10:
         raise ValueError("Not enough samples for training (need at least 10)")
     
-    # Train/test split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
-    
-    # Build preprocessor
+    # Train/test split from one seeded permutation: positional takes skip
+    # train_test_split's input validation and index-alignment machinery
+    perm = np.random.default_rng(42).permutation(len(X))
+    n_test = max(1, int(len(X) * 0.2))
+    test_idx, train_idx = perm[:n_test], perm[n_test:]
+
+    X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
+    y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+
+    # Build preprocessors: scaled + one-hot for linear/kernel models,
+    # ordinal codes without scaling for tree models
     preprocessor = build_preprocessor(numeric_cols, categorical_cols, treat_missing_as_zero)
-    
+    tree_preprocessor = build_tree_preprocessor(numeric_cols, categorical_cols)
+    hgbt_preprocessor = tree_preprocessor
+
+    # HGBT can bin ordinal codes natively when cardinalities fit under max_bins
+    hgbt_categorical_features = None
+    if categorical_cols and all(
+        len(categorical_values.get(col, [])) < _HGBT_MAX_CATEGORIES
+        for col in categorical_cols
+    ):
+        hgbt_categorical_features = list(range(
+            len(numeric_cols), len(numeric_cols) + len(categorical_cols)
+        ))
+        hgbt_preprocessor = build_tree_preprocessor(
+            numeric_cols, categorical_cols, missing_code=np.nan
+        )
+
+    # Fit each preprocessor once and share the transformed arrays across
+    # models, instead of refitting the same transforms inside every pipeline
+    Xtr_linear = preprocessor.fit_transform(X_train)
+    Xte_linear = preprocessor.transform(X_test)
+    Xtr_tree = tree_preprocessor.fit_transform(X_train)
+    Xte_tree = tree_preprocessor.transform(X_test)
+    if hgbt_preprocessor is tree_preprocessor:
+        Xtr_hgbt, Xte_hgbt = Xtr_tree, Xte_tree
+    else:
+        Xtr_hgbt = hgbt_preprocessor.fit_transform(X_train)
+        Xte_hgbt = hgbt_preprocessor.transform(X_test)
+
     # Train linear regression first
     linear_result = train_linear_regression(X_train, y_train, feature_cols, columns_meta)
-    
-    # Train all ML models
-    model_results = []
-    trained_pipelines = {}
-    
+
+    # Convert the target once; every fit and metric works on the same arrays
+    y_train_arr = y_train.to_numpy()
+    y_test_arr = y_test.to_numpy()
+
+    # Train all ML models concurrently; they are independent fits
+    jobs = []
     for label, base_model in MODEL_REGISTRY.items():
         # Create fresh instance of model
-        import copy
-        model = copy.deepcopy(base_model)
-        
-        # Create pipeline
+        model = clone(base_model)
+
+        if label == "Machine Learning - Sigma":
+            if hgbt_categorical_features:
+                model.set_params(categorical_features=hgbt_categorical_features)
+            model_preprocessor, Xtr, Xte = hgbt_preprocessor, Xtr_hgbt, Xte_hgbt
+        elif label in TREE_MODELS:
+            model_preprocessor, Xtr, Xte = tree_preprocessor, Xtr_tree, Xte_tree
+        else:
+            model_preprocessor, Xtr, Xte = preprocessor, Xtr_linear, Xte_linear
+
+        ytr = y_train_arr
+        if label == "Machine Learning - Nova" and Xtr.shape[0] > _SVR_MAX_TRAIN_ROWS:
+            sub = np.random.default_rng(42).choice(
+                Xtr.shape[0], _SVR_MAX_TRAIN_ROWS, replace=False
+            )
+            Xtr, ytr = Xtr[sub], y_train_arr[sub]
+
+        jobs.append((label, model, model_preprocessor, Xtr, ytr, Xte))
+
+    fitted = joblib.Parallel(
+        n_jobs=min(len(jobs), os.cpu_count() or 1), backend='loky'
+    )(
+        joblib.delayed(_fit_one)(label, model, Xtr, ytr, Xte, y_test_arr)
+        for label, model, _, Xtr, ytr, Xte in jobs
+    )
+
+    # Re-wrap the fitted steps so predict() still consumes one Pipeline
+    preprocessors_by_label = {label: pre for label, _, pre, _, _, _ in jobs}
+    model_results = []
+    trained_pipelines = {}
+
+    for result in fitted:
+        if result is None:
+            continue
+
         pipeline = Pipeline([
-            ('preprocessor', preprocessor),
-            ('model', model)
+            ('preprocessor', preprocessors_by_label[result['label']]),
+            ('model', result.pop('model'))
         ])
-        
-        try:
-            # Fit model
-            pipeline.fit(X_train, y_train)
-            
-            # Predict on test set
-            y_pred = pipeline.predict(X_test)
-            
-            # Calculate metrics
-            r2 = round(float(r2_score(y_test, y_pred)), 4)
-            rmse = round(float(np.sqrt(mean_squared_error(y_test, y_pred))), 4)
-            mae = round(float(mean_absolute_error(y_test, y_pred)), 4)
-            mape = _calculate_mape(np.array(y_test), y_pred)
-            if mape is not None:
-                mape = round(mape, 2)
-            
-            model_results.append({
-                'label': label,
-                'r2': r2,
-                'rmse': rmse,
-                'mae': mae,
-                'mape': mape,
-                'pipeline': pipeline
-            })
-            
-            trained_pipelines[label] = pipeline
-            
-        except Exception as e:
-            # Model failed, skip
-            print(f"Model {label} failed: {e}")
-            continue
-    
+        result['pipeline'] = pipeline
+        model_results.append(result)
+        trained_pipelines[result['label']] = pipeline
+
     if not model_results:
         raise ValueError("All models failed to train")
     
@@ -431,42 +573,56 @@ def save_trained_models(
     model_dir = settings.MODELS_DIR / model_id
     model_dir.mkdir(parents=True, exist_ok=True)
     
-    # Save each pipeline
+    # Save each pipeline uncompressed with pickle protocol 5 so the large
+    # estimator arrays can be memory-mapped straight from disk on load
     for label, pipeline in trained_pipelines.items():
         safe_label = label.replace(" ", "_").replace("-", "_")
-        joblib.dump(pipeline, model_dir / f"{safe_label}.joblib")
+        joblib.dump(pipeline, model_dir / f"{safe_label}.joblib", protocol=5)
     
     # Save metadata
     with open(model_dir / "metadata.json", 'w') as f:
         json.dump(metadata, f, indent=2)
-    
+
+    # Drop any stale cached loads now that files changed on disk
+    invalidate_model_cache()
+
     return model_dir
 
 
+@lru_cache(maxsize=32)
 def load_trained_model(model_id: str, model_label: str) -> Pipeline:
-    """Load a trained model from disk."""
+    """Load a trained model from disk (memoized per model_id/label)."""
     model_dir = settings.MODELS_DIR / model_id
     safe_label = model_label.replace(" ", "_").replace("-", "_")
     model_path = model_dir / f"{safe_label}.joblib"
-    
+
     if not model_path.exists():
         raise FileNotFoundError(f"Model not found: {model_label}")
-    
-    return joblib.load(model_path)
 
+    # mmap keeps the estimator arrays on disk until pages are touched,
+    # so cold-start of a large forest does not read the whole file upfront
+    return joblib.load(model_path, mmap_mode='r')
 
+
+@lru_cache(maxsize=64)
 def load_model_metadata(model_id: str) -> dict:
-    """Load model metadata."""
+    """Load model metadata (memoized per model_id)."""
     model_dir = settings.MODELS_DIR / model_id
     metadata_path = model_dir / "metadata.json"
-    
+
     if not metadata_path.exists():
         raise FileNotFoundError(f"Model metadata not found: {model_id}")
-    
+
     with open(metadata_path, 'r') as f:
         return json.load(f)
 
 
+def invalidate_model_cache():
+    """Clear memoized pipelines/metadata (lru_cache cannot evict per key)."""
+    load_trained_model.cache_clear()
+    load_model_metadata.cache_clear()
+
+
 def predict(
     model_id: str,
     model_label: Optional[str],
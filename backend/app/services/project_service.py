@@ -5,8 +5,10 @@ Creates and manages operational projects (MLOps-ready artifacts).
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.models import Dataset, Project, ProjectRun
@@ -18,13 +20,55 @@ from app.schemas.schemas import (
 from app.services.ml_service import load_model_metadata
 
 
+# Parsed input schemas are immutable for a given (project, updated_at), so
+# hot endpoints (predict, detail view) can skip re-validating the JSON into
+# Pydantic models on every request. updated_at doubles as the invalidation
+# token; entries are evicted oldest-first.
+_schema_cache: dict[int, tuple[Any, list[ProjectInputField]]] = {}
+_max_schema_cache_size = 256
+
+
+def get_input_schema(project: Project) -> list[ProjectInputField]:
+    """Validated input schema for a project, cached per process."""
+    token = project.updated_at
+    cached = _schema_cache.get(project.id)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    schema = [ProjectInputField(**f) for f in (project.input_schema or [])]
+    while len(_schema_cache) >= _max_schema_cache_size:
+        _schema_cache.pop(next(iter(_schema_cache)))
+    _schema_cache[project.id] = (token, schema)
+    return schema
+
+
+# columns_meta never changes after upload, so the {col_key: meta} dict can be
+# shared by every project built on the same dataset. Keyed by (id, created_at)
+# in case a dataset id is ever reused.
+_columns_meta_cache: dict[tuple, dict[str, dict]] = {}
+_max_columns_meta_cache_size = 64
+
+
+def _dataset_columns_meta(dataset: Dataset) -> dict[str, dict]:
+    key = (dataset.id, dataset.created_at)
+    cached = _columns_meta_cache.get(key)
+    if cached is not None:
+        return cached
+
+    columns_meta_list = dataset.columns_meta or []
+    columns_meta = {c.get("col_key"): c for c in columns_meta_list if isinstance(c, dict)}
+    while len(_columns_meta_cache) >= _max_columns_meta_cache_size:
+        _columns_meta_cache.pop(next(iter(_columns_meta_cache)))
+    _columns_meta_cache[key] = columns_meta
+    return columns_meta
+
+
 def _build_input_schema(
     dataset: Dataset,
     model_metadata: dict[str, Any],
     features: list[str],
 ) -> list[dict[str, Any]]:
-    columns_meta_list = dataset.columns_meta or []
-    columns_meta = {c.get("col_key"): c for c in columns_meta_list if isinstance(c, dict)}
+    columns_meta = _dataset_columns_meta(dataset)
 
     categorical_values = model_metadata.get("categorical_features", {}) or {}
 
@@ -43,27 +87,27 @@ def _build_input_schema(
         else:
             default_value = 0
 
-        schema.append(ProjectInputField(
-            col_key=col_key,
-            name=meta.get("name", col_key),
-            var_type=var_type,
-            input_type=input_type,
-            required=False,
-            default_value=default_value,
-            allowed_values=allowed_values,
-            description=None,
-        ).model_dump())
+        # Server-constructed values: a plain dict matches what the
+        # ProjectInputField dump produced without paying for validation
+        field: dict[str, Any] = {
+            "col_key": col_key,
+            "name": meta.get("name", col_key),
+            "var_type": var_type,
+            "input_type": input_type,
+            "required": False,
+        }
+        if default_value is not None:
+            field["default_value"] = default_value
+        if allowed_values is not None:
+            field["allowed_values"] = allowed_values
+        schema.append(field)
 
     return schema
 
 
-def create_project(db: Session, project: ProjectCreate) -> Project:
-    dataset = db.query(Dataset).filter(Dataset.id == project.dataset_id).first()
-    if not dataset:
-        raise ValueError("Dataset not found")
-
-    metadata = load_model_metadata(project.model_id)
-
+def _prepare_project_row(
+    dataset: Dataset, metadata: dict[str, Any], project: ProjectCreate
+) -> Project:
     # Basic consistency checks to prevent "project points to wrong artifact" bugs.
     if metadata.get("dataset_id") and int(metadata["dataset_id"]) != int(project.dataset_id):
         raise ValueError("Model artifact was trained on a different dataset_id")
@@ -79,10 +123,13 @@ def create_project(db: Session, project: ProjectCreate) -> Project:
     input_schema = _build_input_schema(dataset, metadata, project.features)
 
     # Persist reproducibility config and metrics.
-    train_config = project.train_config.model_dump() if project.train_config else {}
+    train_config = (
+        project.train_config.model_dump(mode='python', exclude_none=True)
+        if project.train_config else {}
+    )
     model_metrics = metadata.get("model_metrics", {}) or {}
 
-    db_project = Project(
+    return Project(
         name=project.name,
         description=project.description,
         dataset_id=project.dataset_id,
@@ -96,10 +143,38 @@ def create_project(db: Session, project: ProjectCreate) -> Project:
         status=project.status.value if hasattr(project.status, "value") else str(project.status),
     )
 
-    db.add(db_project)
+
+def bulk_create_projects(db: Session, projects: list[ProjectCreate]) -> list[Project]:
+    """
+    Create several projects in one pass: datasets come from a single IN
+    query, model metadata loads overlap on a thread pool, and all rows go
+    to the database in one commit instead of one round-trip per project.
+    """
+    if not projects:
+        return []
+
+    dataset_ids = {p.dataset_id for p in projects}
+    datasets = {
+        d.id: d for d in db.query(Dataset).filter(Dataset.id.in_(dataset_ids)).all()
+    }
+    for p in projects:
+        if p.dataset_id not in datasets:
+            raise ValueError("Dataset not found")
+
+    with ThreadPoolExecutor(max_workers=min(len(projects), 8)) as ex:
+        metas = list(ex.map(load_model_metadata, [p.model_id for p in projects]))
+
+    rows = [
+        _prepare_project_row(datasets[p.dataset_id], meta, p)
+        for p, meta in zip(projects, metas)
+    ]
+    db.add_all(rows)
     db.commit()
-    db.refresh(db_project)
-    return db_project
+    return rows
+
+
+def create_project(db: Session, project: ProjectCreate) -> Project:
+    return bulk_create_projects(db, [project])[0]
 
 
 def get_project(db: Session, project_id: int) -> Optional[Project]:
@@ -107,17 +182,50 @@ def get_project(db: Session, project_id: int) -> Optional[Project]:
 
 
 def list_projects(db: Session, limit: int = 200, offset: int = 0) -> tuple[list[Project], int]:
-    q = db.query(Project)
-    total = q.count()
-    projects = (
-        q.order_by(Project.updated_at.desc())
+    # Window count rides along the page query, so rows + total cost one
+    # round-trip instead of a separate COUNT
+    rows = (
+        db.query(Project, func.count().over().label("total"))
+        .order_by(Project.updated_at.desc())
         .offset(offset)
         .limit(limit)
         .all()
     )
+    projects = [row[0] for row in rows]
+    # An empty page past the end still needs the real total
+    total = rows[0][1] if rows else (db.query(func.count(Project.id)).scalar() or 0)
     return projects, total
 
 
+def list_projects_summary(db: Session, limit: int = 200, offset: int = 0) -> tuple[list, int]:
+    """
+    Lightweight listing: only the columns the list view shows, so the large
+    JSON payloads (input_schema, train_config, metrics) never leave the
+    database. The dataset name joins in here instead of one query per row.
+    """
+    rows = (
+        db.query(
+            Project.id,
+            Project.name,
+            Project.dataset_id,
+            Dataset.name.label("dataset_name"),
+            Project.model_label,
+            Project.target,
+            Project.status,
+            Project.created_at,
+            Project.updated_at,
+            func.count().over().label("total"),
+        )
+        .outerjoin(Dataset, Dataset.id == Project.dataset_id)
+        .order_by(Project.updated_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    total = rows[0].total if rows else (db.query(func.count(Project.id)).scalar() or 0)
+    return rows, total
+
+
 def update_project(db: Session, project_id: int, update: ProjectUpdate) -> Optional[Project]:
     project = get_project(db, project_id)
     if not project:
@@ -141,6 +249,7 @@ def delete_project(db: Session, project_id: int) -> bool:
         return False
     db.delete(project)
     db.commit()
+    _schema_cache.pop(project_id, None)
     return True
 
 
@@ -161,7 +270,7 @@ def log_project_run(
     )
     db.add(run)
     db.commit()
-    db.refresh(run)
+    # Logged per prediction; skipping the refresh SELECT halves its DB traffic
     return run
 
 
@@ -171,12 +280,18 @@ def list_project_runs(
     limit: int = 50,
     offset: int = 0,
 ) -> tuple[list[ProjectRun], int]:
-    q = db.query(ProjectRun).filter(ProjectRun.project_id == project_id)
-    total = q.count()
-    runs = (
-        q.order_by(ProjectRun.created_at.desc())
+    rows = (
+        db.query(ProjectRun, func.count().over().label("total"))
+        .filter(ProjectRun.project_id == project_id)
+        .order_by(ProjectRun.created_at.desc())
         .offset(offset)
         .limit(limit)
         .all()
     )
+    runs = [row[0] for row in rows]
+    total = rows[0][1] if rows else (
+        db.query(func.count(ProjectRun.id))
+        .filter(ProjectRun.project_id == project_id)
+        .scalar() or 0
+    )
     return runs, total
@@ -3,6 +3,7 @@ Orion Analytics - Scenario Service
 Manages saved scenarios.
 """
 from typing import Optional
+from sqlalchemy import case, func, insert, literal, select
 from sqlalchemy.orm import Session
 
 from app.db.models import Scenario
@@ -15,11 +16,13 @@ def create_scenario(db: Session, scenario: ScenarioCreate) -> Scenario:
         name=scenario.name,
         description=scenario.description,
         dataset_id=scenario.dataset_id,
-        payload=scenario.payload.model_dump()
+        # None fields are restored by ScenarioPayload defaults on read, so
+        # dropping them shrinks the stored JSON for free
+        payload=scenario.payload.model_dump(mode='python', exclude_none=True)
     )
     db.add(db_scenario)
     db.commit()
-    db.refresh(db_scenario)
+    # No refresh: flush populated id and the Python-side defaults already
     return db_scenario
 
 
@@ -53,7 +56,7 @@ def update_scenario(
     if update.description is not None:
         scenario.description = update.description
     if update.payload is not None:
-        scenario.payload = update.payload.model_dump()
+        scenario.payload = update.payload.model_dump(mode='python', exclude_none=True)
     
     db.commit()
     db.refresh(scenario)
@@ -73,17 +76,29 @@ def delete_scenario(db: Session, scenario_id: int) -> bool:
 
 def duplicate_scenario(db: Session, scenario_id: int, new_name: str) -> Optional[Scenario]:
     """Duplicate a scenario with a new name."""
-    original = get_scenario(db, scenario_id)
-    if not original:
-        return None
-    
-    new_scenario = Scenario(
-        name=new_name,
-        description=f"Copy of: {original.description}" if original.description else None,
-        dataset_id=original.dataset_id,
-        payload=original.payload
+    # Server-side INSERT ... SELECT: the payload JSON is copied inside the
+    # database instead of round-tripping through Python
+    source = select(
+        literal(new_name),
+        case(
+            (Scenario.description.isnot(None), literal("Copy of: ") + Scenario.description),
+            else_=None,
+        ),
+        Scenario.dataset_id,
+        Scenario.payload,
+        func.now(),
+        func.now(),
+    ).where(Scenario.id == scenario_id)
+    result = db.execute(
+        insert(Scenario)
+        .from_select(
+            ["name", "description", "dataset_id", "payload", "created_at", "updated_at"],
+            source,
+        )
+        .returning(Scenario.id)
     )
-    db.add(new_scenario)
+    new_id = result.scalar()
     db.commit()
-    db.refresh(new_scenario)
-    return new_scenario
+    if new_id is None:
+        return None
+    return db.get(Scenario, new_id)
@@ -2,7 +2,12 @@
 Orion Analytics - Statistics Service
 Calculates descriptive statistics, correlation, and group comparisons.
 """
+import functools
 import math
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 from scipy import stats as scipy_stats
@@ -48,28 +53,63 @@ def normalize_group_columns(df: pd.DataFrame, group_cols: list[str]) -> pd.DataF
     if not group_cols:
         return df
 
-    normalized = df.copy()
+    replacements: dict[str, pd.Series] = {}
     for col in group_cols:
-        if col not in normalized.columns:
+        if col not in df.columns:
             continue
-        series = normalized[col]
+        series = df[col]
         if (
             pd.api.types.is_object_dtype(series)
             or pd.api.types.is_string_dtype(series)
             or pd.api.types.is_categorical_dtype(series)
         ):
-            normalized[col] = series.map(_normalize_group_value)
-    return normalized
+            # Normalize each distinct label once and map the result back;
+            # repeated labels (the normal case for group columns) then cost
+            # a dict lookup instead of a split/join per row
+            try:
+                mapping = {
+                    value: _normalize_group_value(value)
+                    for value in series.unique()
+                    if not pd.isna(value)
+                }
+                replacements[col] = series.map(mapping)
+            except TypeError:
+                # Unhashable values: keep the per-row path
+                replacements[col] = series.map(_normalize_group_value)
+
+    if not replacements:
+        # Nothing textual to clean (numeric/datetime buckets): no copy needed
+        return df
+    # Only the changed columns are materialized; the rest stay shared
+    return df.assign(**replacements)
 
 
-def _safe_group_mean_for_sort(group_df: pd.DataFrame, variable: str) -> float:
-    """Numeric-safe group mean used only for sorting groups."""
-    if variable not in group_df.columns:
-        return float("-inf")
-    numeric = pd.to_numeric(group_df[variable], errors="coerce")
-    if numeric.notna().sum() == 0:
-        return float("-inf")
-    return float(numeric.mean())
+def _presorted_group_indices(df: pd.DataFrame, group_cols: list[str]) -> Optional[dict]:
+    """
+    Scan-based replacement for groupby().indices when a single group column
+    is already sorted (common for time-series and pre-aggregated uploads):
+    group boundaries fall out of one neighbor comparison, skipping the
+    hash-based groupby entirely. Returns None when the fast path does not
+    apply; the result matches groupby().indices key-for-key.
+    """
+    if len(group_cols) != 1:
+        return None
+    series = df[group_cols[0]]
+    try:
+        if series.isna().any() or not series.is_monotonic_increasing:
+            return None
+    except TypeError:
+        return None
+
+    values = series.to_numpy()
+    if values.size == 0:
+        return {}
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    ends = np.r_[starts[1:], values.size]
+    return {
+        values[start]: np.arange(start, end)
+        for start, end in zip(starts, ends)
+    }
 
 
 def _build_group_practical_explanation(
@@ -90,10 +130,12 @@ def _build_group_practical_explanation(
         )
 
     center_label = "media" if is_normal else "mediana"
-    centers = [
-        float(np.mean(values)) if is_normal else float(np.median(values))
-        for values in group_data
-    ]
+    # All group centers in one padded nan-aware reduction instead of one
+    # NumPy call per group
+    padded = np.full((len(group_data), max(len(values) for values in group_data)), np.nan)
+    for i, values in enumerate(group_data):
+        padded[i, :len(values)] = values
+    centers = np.nanmean(padded, axis=1) if is_normal else np.nanmedian(padded, axis=1)
 
     top_idx = int(np.argmax(centers))
     bottom_idx = int(np.argmin(centers))
@@ -168,6 +210,232 @@ def _build_group_practical_explanation(
     return f"{intro}{group_context}{action}{normality_note}{sample_note}"
 
 
+_QUANTILES = (0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)
+
+
+@functools.lru_cache(maxsize=4096)
+def _t_critical(confidence_level: float, df: int) -> float:
+    """Student-t critical value, cached: grouped runs repeat the same (level, df) pairs."""
+    if df <= 0:
+        return float("nan")
+    return float(scipy_stats.t.ppf((1 + confidence_level) / 2, df=df))
+
+
+def _mode_value(arr: np.ndarray) -> Optional[float]:
+    """
+    Smallest most-frequent value (scipy.stats.mode tie rule): bincount for
+    small-range integer data, unique+argmax otherwise.
+    """
+    if arr.size == 0:
+        return None
+    lo = float(arr.min())
+    hi = float(arr.max())
+    if (
+        np.isfinite(lo) and np.isfinite(hi)
+        and hi - lo <= 1_000_000
+        and np.all(arr == np.floor(arr))
+    ):
+        bin_counts = np.bincount((arr - lo).astype(np.int64))
+        return float(bin_counts.argmax() + lo)
+    uniq_vals, uniq_counts = np.unique(arr, return_counts=True)
+    return float(uniq_vals[uniq_counts.argmax()])
+
+
+def _batch_skew_kurtosis(
+    X: np.ndarray, counts: np.ndarray, means: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise adjusted skewness/kurtosis matching pandas Series.skew() and
+    Series.kurtosis(), computed from shared centered powers so the matrix is
+    scanned once instead of twice per column. Constants yield 0 like pandas.
+    """
+    d = np.nan_to_num(X - means)
+    d2 = d * d
+    d3 = d2 * d
+    n = counts.astype(np.float64)
+
+    m2 = d2.sum(axis=0) / n
+    m3 = d3.sum(axis=0) / n
+    m4 = (d3 * d).sum(axis=0) / n
+
+    skew = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+    g2 = m4 / (m2 * m2) - 3.0
+    kurt = ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
+    return np.nan_to_num(skew), np.nan_to_num(kurt)
+
+
+def _column_values(series: pd.Series) -> tuple[Optional[np.ndarray], np.ndarray]:
+    """
+    (float64 values, isna mask) for a column. Only true numeric dtypes get
+    values: str/object/bool columns return None and stay counts-only even
+    when a slice happens to hold parseable values, matching how the pandas
+    reductions behaved before the batch path existed.
+    """
+    isna = series.isna().to_numpy()
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        try:
+            return series.to_numpy(dtype=np.float64), isna
+        except (TypeError, ValueError):
+            pass
+    return None, isna
+
+
+def _calculate_many_column_stats(
+    df: pd.DataFrame,
+    variables: list[str],
+    columns_meta: dict[str, str],
+    treat_missing_as_zero: bool = True,
+    confidence_level: float = 0.95,
+    total_count_for_group_pct: int = None,
+    column_cache: Optional[dict] = None,
+    row_indices: Optional[np.ndarray] = None,
+) -> list[ColumnStats]:
+    """
+    Descriptive statistics for every requested column at once. All numeric
+    columns share one float64 matrix, so each aggregate (means, quantiles,
+    moments, intervals) is a single axis-aware NumPy call across columns
+    instead of a per-column pandas dispatch.
+
+    When a caller computes stats for many row subsets of the same frame
+    (the per-group loop), it passes a shared column_cache so each column is
+    converted once, plus row_indices selecting the subset — the group then
+    never needs to be materialized as its own DataFrame.
+    """
+    total_count = len(row_indices) if row_indices is not None else len(df)
+    group_pct = round(total_count / total_count_for_group_pct * 100, 2) if total_count_for_group_pct and total_count_for_group_pct > 0 else None
+
+    present = [var for var in variables if var in df.columns]
+    stats_by_col: dict[str, ColumnStats] = {}
+    numeric_cols: list[str] = []
+    arrays: list[np.ndarray] = []
+    missing_by_col: dict[str, int] = {}
+
+    for col_key in present:
+        if column_cache is not None:
+            cached = column_cache.get(col_key)
+            if cached is None:
+                cached = _column_values(df[col_key])
+                column_cache[col_key] = cached
+            values, isna = cached
+        else:
+            values, isna = _column_values(df[col_key])
+
+        if row_indices is not None:
+            isna = isna[row_indices]
+        missing_count = int(np.count_nonzero(isna))
+        missing_by_col[col_key] = missing_count
+
+        if values is not None:
+            arrays.append(values[row_indices] if row_indices is not None else values)
+            numeric_cols.append(col_key)
+        else:
+            # Non-numeric column: counts-only payload, as before
+            stats_by_col[col_key] = ColumnStats(
+                col_key=col_key, name=columns_meta.get(col_key, col_key),
+                count=total_count, missing_count=missing_count,
+                missing_pct=round(missing_count / total_count * 100, 2) if total_count > 0 else 0.0,
+                group_pct=group_pct,
+            )
+
+    if numeric_cols:
+        X = np.column_stack(arrays)
+        if treat_missing_as_zero:
+            X = np.nan_to_num(X)
+        counts = np.count_nonzero(~np.isnan(X), axis=0)
+
+        with warnings.catch_warnings(), np.errstate(all='ignore'):
+            # Degenerate columns surface as NaN (dropped to None on output)
+            warnings.simplefilter('ignore')
+
+            means = np.nanmean(X, axis=0)
+            variances = np.nanvar(X, axis=0, ddof=1)
+            stds = np.sqrt(variances)
+            mins = np.nanmin(X, axis=0)
+            maxs = np.nanmax(X, axis=0)
+            sums = np.nansum(X, axis=0)
+            quants = np.nanquantile(X, _QUANTILES, axis=0)
+            skews, kurts = _batch_skew_kurtosis(X, counts, means)
+            sems = stds / np.sqrt(counts)
+            cvs = np.round(stds / means * 100, 4)
+            t_crit = np.array(
+                [_t_critical(confidence_level, int(c) - 1) for c in counts]
+            )
+            ci_lowers = means - t_crit * sems
+            ci_uppers = means + t_crit * sems
+
+            # One finalization pass does what _safe_round did per field:
+            # round to 4 decimals and turn non-finite values into NaN, read
+            # back as None during packaging below
+            stat_rows = np.vstack([
+                means, quants[3], stds, variances, mins, maxs,
+                quants[2], quants[4], quants[4] - quants[2], sems, cvs,
+                maxs - mins, quants[0], quants[1], quants[5], quants[6],
+                skews, kurts, ci_lowers, ci_uppers, sums,
+            ])
+            stat_rows = np.where(
+                np.isfinite(stat_rows), np.round(stat_rows, 4), np.nan
+            )
+
+        for j, col_key in enumerate(numeric_cols):
+            col_name = columns_meta.get(col_key, col_key)
+            missing_count = missing_by_col[col_key]
+            missing_pct = round(missing_count / total_count * 100, 2) if total_count > 0 else 0.0
+            n = int(counts[j])
+
+            if n == 0:
+                stats_by_col[col_key] = ColumnStats(
+                    col_key=col_key, name=col_name,
+                    count=total_count, missing_count=missing_count,
+                    missing_pct=missing_pct, group_pct=group_pct,
+                )
+                continue
+
+            col = X[:, j]
+            if n < total_count:
+                col = col[~np.isnan(col)]
+
+            ci_ok = n > 1 and np.isfinite(sems[j]) and sems[j] > 0
+
+            (mean_r, median_r, std_r, var_r, min_r, max_r, q1_r, q3_r,
+             iqr_r, sem_r, cv_r, range_r, p5_r, p10_r, p90_r, p95_r,
+             skew_r, kurt_r, ci_lo_r, ci_hi_r, sum_r) = [
+                None if np.isnan(v) else float(v) for v in stat_rows[:, j]
+            ]
+
+            stats_by_col[col_key] = ColumnStats(
+                col_key=col_key,
+                name=col_name,
+                count=total_count,
+                missing_count=missing_count,
+                mean=mean_r,
+                median=median_r,
+                mode=_safe_round(_mode_value(col)),
+                std=std_r,
+                variance=var_r,
+                min=min_r,
+                max=max_r,
+                q1=q1_r,
+                q3=q3_r,
+                iqr=iqr_r,
+                sem=sem_r,
+                cv=cv_r if means[j] != 0 else None,
+                range=range_r,
+                p5=p5_r,
+                p10=p10_r,
+                p90=p90_r,
+                p95=p95_r,
+                skewness=skew_r if n >= 3 else None,
+                kurtosis=kurt_r if n >= 4 else None,
+                ci_lower=ci_lo_r if ci_ok else None,
+                ci_upper=ci_hi_r if ci_ok else None,
+                sum=sum_r,
+                missing_pct=_safe_round(missing_pct, 2),
+                group_pct=_safe_round(group_pct, 2),
+            )
+
+    return [stats_by_col[col_key] for col_key in present]
+
+
 def calculate_column_stats(
     series: pd.Series,
     col_key: str,
@@ -177,103 +445,10 @@ def calculate_column_stats(
     total_count_for_group_pct: int = None,
 ) -> ColumnStats:
     """Calculate descriptive statistics for a single column."""
-    missing_count = int(series.isna().sum())
-    total_count = len(series)
-
-    if treat_missing_as_zero:
-        series = series.fillna(0)
-    else:
-        series = series.dropna()
-
-    n = len(series)
-    missing_pct = round(missing_count / total_count * 100, 2) if total_count > 0 else 0.0
-    group_pct = round(total_count / total_count_for_group_pct * 100, 2) if total_count_for_group_pct and total_count_for_group_pct > 0 else None
-
-    if n == 0:
-        return ColumnStats(
-            col_key=col_key, name=col_name,
-            count=total_count, missing_count=missing_count,
-            missing_pct=missing_pct, group_pct=group_pct,
-        )
-
-    try:
-        mean_val = float(series.mean())
-        median_val = float(series.median())
-        std_val = float(series.std())
-        var_val = float(series.var())
-        min_val = float(series.min())
-        max_val = float(series.max())
-        q1_val = float(series.quantile(0.25))
-        q3_val = float(series.quantile(0.75))
-        iqr_val = q3_val - q1_val
-        sum_val = float(series.sum())
-        range_val = max_val - min_val
-
-        # Mode
-        mode_result = scipy_stats.mode(series, keepdims=True)
-        mode_val = float(mode_result.mode[0]) if len(mode_result.mode) > 0 else None
-
-        # SEM
-        sem_val = std_val / math.sqrt(n) if n > 0 and std_val is not None else None
-
-        # CV
-        cv_val = round(std_val / mean_val * 100, 4) if mean_val != 0 else None
-
-        # Additional percentiles
-        p5_val = float(series.quantile(0.05))
-        p10_val = float(series.quantile(0.10))
-        p90_val = float(series.quantile(0.90))
-        p95_val = float(series.quantile(0.95))
-
-        # Skewness & Kurtosis
-        skewness_val = float(series.skew()) if n >= 3 else None
-        kurtosis_val = float(series.kurtosis()) if n >= 4 else None
-
-        # Confidence Interval
-        ci_lower_val = None
-        ci_upper_val = None
-        if n > 1 and sem_val and sem_val > 0:
-            t_crit = scipy_stats.t.ppf((1 + confidence_level) / 2, df=n - 1)
-            ci_lower_val = mean_val - t_crit * sem_val
-            ci_upper_val = mean_val + t_crit * sem_val
-
-    except Exception:
-        return ColumnStats(
-            col_key=col_key, name=col_name,
-            count=total_count, missing_count=missing_count,
-            missing_pct=missing_pct, group_pct=group_pct,
-        )
-
-    return ColumnStats(
-        col_key=col_key,
-        name=col_name,
-        count=total_count,
-        missing_count=missing_count,
-        mean=_safe_round(mean_val),
-        median=_safe_round(median_val),
-        mode=_safe_round(mode_val),
-        std=_safe_round(std_val),
-        variance=_safe_round(var_val),
-        min=_safe_round(min_val),
-        max=_safe_round(max_val),
-        q1=_safe_round(q1_val),
-        q3=_safe_round(q3_val),
-        iqr=_safe_round(iqr_val),
-        sem=_safe_round(sem_val),
-        cv=_safe_round(cv_val),
-        range=_safe_round(range_val),
-        p5=_safe_round(p5_val),
-        p10=_safe_round(p10_val),
-        p90=_safe_round(p90_val),
-        p95=_safe_round(p95_val),
-        skewness=_safe_round(skewness_val),
-        kurtosis=_safe_round(kurtosis_val),
-        ci_lower=_safe_round(ci_lower_val),
-        ci_upper=_safe_round(ci_upper_val),
-        sum=_safe_round(sum_val),
-        missing_pct=_safe_round(missing_pct, 2),
-        group_pct=_safe_round(group_pct, 2),
-    )
+    return _calculate_many_column_stats(
+        series.to_frame(col_key), [col_key], {col_key: col_name},
+        treat_missing_as_zero, confidence_level, total_count_for_group_pct,
+    )[0]
 
 
 def compare_groups(
@@ -283,25 +458,50 @@ def compare_groups(
     columns_meta: dict[str, str],
     alpha: float = 0.05,
     treat_missing_as_zero: bool = True,
+    precomputed_indices: Optional[dict] = None,
+    force_test: Optional[str] = None,
 ) -> list[GroupComparisonTest]:
     """
     Compare groups statistically for each variable.
     Automatic test selection:
     - 2 groups: t-test or Mann-Whitney
     - 3+ groups: ANOVA or Kruskal-Wallis
+
+    When calculate_descriptive_stats has already normalized the group
+    column and built the groupby indices, it passes them in via
+    precomputed_indices (with df already normalized) so the key-building
+    work is not repeated here.
+
+    force_test="parametric" or "nonparametric" bypasses the normality
+    check and routes every variable to that family directly; callers who
+    already know which test they want then pay nothing for assumption
+    testing (Levene still runs in the parametric case to pick Student vs
+    Welch).
     """
     results = []
 
     if group_by_col not in df.columns:
         return results
 
-    normalized_df = normalize_group_columns(df, [group_by_col])
-    groups = normalized_df.groupby(group_by_col)
-    group_keys = list(groups.groups.keys())
+    # Positional row indices per group, materialized once; slicing a column
+    # by these is far cheaper than get_group() re-indexing the frame for
+    # every variable x group pair
+    if precomputed_indices is not None:
+        normalized_df = df
+        group_indices = precomputed_indices
+    else:
+        normalized_df = normalize_group_columns(df, [group_by_col])
+        group_indices = _presorted_group_indices(normalized_df, [group_by_col])
+        if group_indices is None:
+            group_indices = normalized_df.groupby(group_by_col, observed=True).indices
+    group_keys = list(group_indices.keys())
 
     if len(group_keys) < 2:
         return results
 
+    # Phase 1: gather the per-group arrays for every variable
+    collected: list[dict] = []
+
     for var in variables:
         if var not in df.columns:
             continue
@@ -309,59 +509,131 @@ def compare_groups(
         var_name = columns_meta.get(var, var)
 
         try:
+            # Coerce the column once; per group it is just a fancy-indexed
+            # slice plus a NaN filter. Truly missing entries become 0 in the
+            # fill mode while non-coercible junk stays NaN and is dropped,
+            # exactly as the old fillna-then-coerce sequence behaved.
+            var_series = normalized_df[var]
+            col_numeric = pd.to_numeric(var_series, errors='coerce').to_numpy(dtype=np.float64)
+            if treat_missing_as_zero:
+                col_numeric = np.where(var_series.isna().to_numpy(), 0.0, col_numeric)
+
             # Collect group data
             group_data = []
             valid_group_keys = []
             for key in group_keys:
-                g = groups.get_group(key)[var].copy()
-                if treat_missing_as_zero:
-                    g = g.fillna(0)
-                else:
-                    g = g.dropna()
-                g = pd.to_numeric(g, errors='coerce').dropna()
+                g = col_numeric[group_indices[key]]
+                g = g[~np.isnan(g)]
                 if len(g) >= 2:
-                    group_data.append(g.values)
+                    group_data.append(g)
                     valid_group_keys.append(str(key))
 
             if len(group_data) < 2:
                 continue
 
+            # A constant variable cannot differ across groups; skip it
+            # before any assumption testing. (3+ groups already produced
+            # nothing here — Kruskal rejects identical data — so this just
+            # makes the 2-group case consistent.)
+            if min(g.min() for g in group_data) == max(g.max() for g in group_data):
+                continue
+
+            collected.append({
+                "var": var, "var_name": var_name,
+                "group_data": group_data,
+                "valid_group_keys": valid_group_keys,
+            })
+        except Exception:
+            continue
+
+    # Phase 2: homogeneity of variance — one axis-aware Levene call per
+    # distinct set of valid group keys (usually just one), padding each
+    # group's samples across variables with NaN; identical to the
+    # per-variable calls, with those kept as the fallback.
+    by_signature: dict[tuple, list[int]] = {}
+    if force_test == "nonparametric":
+        # Rank tests never consult the homogeneity flag
+        for entry in collected:
+            entry["homogeneous"] = False
+    else:
+        for i, entry in enumerate(collected):
+            by_signature.setdefault(tuple(entry["valid_group_keys"]), []).append(i)
+    for signature, idxs in by_signature.items():
+        entries = [collected[i] for i in idxs]
+        try:
+            mats = []
+            for g in range(len(signature)):
+                width = max(len(e["group_data"][g]) for e in entries)
+                mat = np.full((len(entries), width), np.nan)
+                for r, e in enumerate(entries):
+                    mat[r, :len(e["group_data"][g])] = e["group_data"][g]
+                mats.append(mat)
+            p_levs = np.atleast_1d(
+                scipy_stats.levene(*mats, axis=1, nan_policy='omit').pvalue
+            )
+            for r, i in enumerate(idxs):
+                collected[i]["homogeneous"] = bool(p_levs[r] > alpha)
+        except Exception:
+            for i in idxs:
+                try:
+                    _, p_lev = scipy_stats.levene(*collected[i]["group_data"])
+                    collected[i]["homogeneous"] = bool(p_lev > alpha)
+                except Exception:
+                    collected[i]["homogeneous"] = False
+
+    # Phase 3: per variable, assumptions, effect size and tests; Mann-
+    # Whitney is deferred so all 2-group nonparametric variables go
+    # through one batched scipy call.
+    pending: list[dict] = []
+
+    for entry in collected:
+        var = entry["var"]
+        var_name = entry["var_name"]
+
+        try:
+            group_data = entry["group_data"]
+            valid_group_keys = entry["valid_group_keys"]
             n_groups = len(group_data)
 
-            # Check normality per group
-            normal_count = 0
-            for gd in group_data:
-                if len(gd) >= 8 and len(gd) < 5000:
-                    try:
-                        _, p_norm = scipy_stats.shapiro(gd)
-                        if p_norm > alpha:
-                            normal_count += 1
-                    except Exception:
-                        pass
-                elif len(gd) >= 20:
+            # Check normality per group: one padded D'Agostino call covers
+            # every group with n >= 20, smaller groups count as non-normal
+            # (inconclusive at that size). D'Agostino is moment-based — no
+            # per-group sort like Shapiro — and vectorizes across groups.
+            # At very large n the formal test is skipped entirely: it flags
+            # harmless deviations while the CLT already justifies the
+            # parametric route.
+            total_n = sum(len(gd) for gd in group_data)
+            if force_test is not None:
+                is_normal = force_test == "parametric"
+            elif total_n > 20000:
+                is_normal = True
+            else:
+                normal_count = 0
+                big = [gd for gd in group_data if len(gd) >= 20]
+                if big:
+                    padded = np.full((len(big), max(len(gd) for gd in big)), np.nan)
+                    for i, gd in enumerate(big):
+                        padded[i, :len(gd)] = gd
                     try:
-                        _, p_norm = scipy_stats.normaltest(gd)
-                        if p_norm > alpha:
-                            normal_count += 1
+                        _, p_norms = scipy_stats.normaltest(
+                            padded, axis=1, nan_policy='omit'
+                        )
+                        normal_count = int(np.count_nonzero(p_norms > alpha))
                     except Exception:
                         pass
 
-            is_normal = normal_count >= len(group_data) * 0.5
+                is_normal = normal_count >= len(group_data) * 0.5
 
-            # Check homogeneity of variance
-            is_homogeneous = False
-            try:
-                _, p_lev = scipy_stats.levene(*group_data)
-                is_homogeneous = p_lev > alpha
-            except Exception:
-                pass
+            # Homogeneity of variance comes from the batched Levene above
+            is_homogeneous = entry["homogeneous"]
 
             assumptions = {
                 "normalidade": is_normal,
                 "homocedasticidade": is_homogeneous,
             }
 
-            # Select and run test
+            # Select and run test (Mann-Whitney deferred to the batch below)
+            stat_val = p_val = None
             if n_groups == 2:
                 if is_normal:
                     stat_val, p_val = scipy_stats.ttest_ind(
@@ -371,9 +643,6 @@ def compare_groups(
                     test_name = "Welch's t-test" if not is_homogeneous else "t-test independente"
                     test_display = "Teste t" if is_homogeneous else "Teste t de Welch"
                 else:
-                    stat_val, p_val = scipy_stats.mannwhitneyu(
-                        group_data[0], group_data[1], alternative='two-sided'
-                    )
                     test_name = "Mann-Whitney U"
                     test_display = "Mann-Whitney U"
 
@@ -409,11 +678,16 @@ def compare_groups(
                     test_name = "Kruskal-Wallis"
                     test_display = "Kruskal-Wallis"
 
-                # Effect size: eta-squared
+                # Effect size: eta-squared, from per-group sums so the
+                # between-group term is one vectorized expression and the
+                # total term one dot product over the centered data
                 all_data = np.concatenate(group_data)
                 grand_mean = np.mean(all_data)
-                ss_between = sum(len(gd) * (np.mean(gd) - grand_mean) ** 2 for gd in group_data)
-                ss_total = np.sum((all_data - grand_mean) ** 2)
+                sizes = np.array([gd.size for gd in group_data], dtype=np.float64)
+                group_means = np.array([gd.sum() for gd in group_data]) / sizes
+                ss_between = float(np.sum(sizes * (group_means - grand_mean) ** 2))
+                centered = all_data - grand_mean
+                ss_total = float(centered @ centered)
                 eta_sq = ss_between / ss_total if ss_total > 0 else 0
                 effect_val = round(eta_sq, 4)
                 effect_name = "eta2"
@@ -426,6 +700,68 @@ def compare_groups(
                 else:
                     effect_interp = "grande"
 
+            pending.append({
+                "var": var, "var_name": var_name,
+                "group_data": group_data, "valid_group_keys": valid_group_keys,
+                "is_normal": is_normal, "assumptions": assumptions,
+                "stat_val": stat_val, "p_val": p_val,
+                "test_name": test_name, "test_display": test_display,
+                "effect_val": effect_val, "effect_name": effect_name,
+                "effect_interp": effect_interp,
+            })
+
+        except Exception:
+            continue
+
+    # Phase 4: one NaN-padded, axis-aware Mann-Whitney call covers every
+    # deferred variable; scipy's omit policy reproduces the per-pair calls
+    # exactly, including the exact-method small-sample regime.
+    deferred = [entry for entry in pending if entry["stat_val"] is None]
+    if deferred:
+        try:
+            max_n1 = max(len(entry["group_data"][0]) for entry in deferred)
+            max_n2 = max(len(entry["group_data"][1]) for entry in deferred)
+            X = np.full((max_n1, len(deferred)), np.nan)
+            Y = np.full((max_n2, len(deferred)), np.nan)
+            for j, entry in enumerate(deferred):
+                X[:len(entry["group_data"][0]), j] = entry["group_data"][0]
+                Y[:len(entry["group_data"][1]), j] = entry["group_data"][1]
+            res = scipy_stats.mannwhitneyu(
+                X, Y, alternative='two-sided', axis=0, nan_policy='omit'
+            )
+            for j, entry in enumerate(deferred):
+                entry["stat_val"] = res.statistic[j]
+                entry["p_val"] = res.pvalue[j]
+        except Exception:
+            for entry in deferred:
+                try:
+                    entry["stat_val"], entry["p_val"] = scipy_stats.mannwhitneyu(
+                        entry["group_data"][0], entry["group_data"][1],
+                        alternative='two-sided',
+                    )
+                except Exception:
+                    pass
+
+    # Phase 5: build the response objects in the original variable order
+    for entry in pending:
+        try:
+            var = entry["var"]
+            var_name = entry["var_name"]
+            group_data = entry["group_data"]
+            valid_group_keys = entry["valid_group_keys"]
+            is_normal = entry["is_normal"]
+            assumptions = entry["assumptions"]
+            stat_val = entry["stat_val"]
+            p_val = entry["p_val"]
+            test_name = entry["test_name"]
+            test_display = entry["test_display"]
+            effect_val = entry["effect_val"]
+            effect_name = entry["effect_name"]
+            effect_interp = entry["effect_interp"]
+
+            if stat_val is None or p_val is None:
+                continue
+
             significant = p_val < alpha
             p_str = f"p < 0.001" if p_val < 0.001 else f"p = {p_val:.4f}"
 
@@ -505,16 +841,10 @@ def calculate_descriptive_stats(
 
     sample_size = len(df)
 
-    # Overall statistics
-    overall_stats = []
-    for col_key in variables:
-        if col_key in df.columns:
-            col_name = columns_meta.get(col_key, col_key)
-            col_stats = calculate_column_stats(
-                df[col_key].copy(), col_key, col_name,
-                treat_missing_as_zero, confidence_level,
-            )
-            overall_stats.append(col_stats)
+    # Overall statistics, all variables in one vectorized pass
+    overall_stats = _calculate_many_column_stats(
+        df, variables, columns_meta, treat_missing_as_zero, confidence_level,
+    )
 
     # Grouped statistics
     grouped_stats = None
@@ -529,22 +859,78 @@ def calculate_descriptive_stats(
             grouped_stats = {}
             group_summaries = []
             grouped_df = normalize_group_columns(df, valid_group_by)
-            groups = list(grouped_df.groupby(valid_group_by))
-            total_groups = len(groups)
-
-            # Sort groups
+            # One set of indices serves the grouped stats, the sorting and
+            # the comparison tests below; keys stay in sorted order either way
+            group_indices = _presorted_group_indices(grouped_df, valid_group_by)
+            if group_indices is None:
+                group_indices = grouped_df.groupby(valid_group_by, observed=True).indices
+            group_keys = list(group_indices.keys())
+            total_groups = len(group_keys)
+
+            # Sort and trim on the keys alone, so only the kept groups are
+            # ever materialized as DataFrame slices below
             if sort_groups_by == "count":
-                groups.sort(key=lambda x: len(x[1]), reverse=True)
-            elif sort_groups_by == "mean_asc" and variables:
-                groups.sort(key=lambda x: _safe_group_mean_for_sort(x[1], variables[0]))
-            elif sort_groups_by == "mean_desc" and variables:
-                groups.sort(key=lambda x: _safe_group_mean_for_sort(x[1], variables[0]), reverse=True)
+                group_keys.sort(key=lambda k: len(group_indices[k]), reverse=True)
+            elif sort_groups_by in ("mean_asc", "mean_desc") and variables:
+                # Coerce the sort variable once and take every group mean in
+                # one bincount pass instead of re-running to_numeric per group
+                if variables[0] in grouped_df.columns:
+                    sort_col = pd.to_numeric(
+                        grouped_df[variables[0]], errors="coerce"
+                    ).to_numpy(dtype=np.float64)
+                    sizes = np.fromiter(
+                        (len(group_indices[key]) for key in group_keys),
+                        dtype=np.int64, count=len(group_keys),
+                    )
+                    vals = sort_col[np.concatenate([group_indices[key] for key in group_keys])]
+                    valid = ~np.isnan(vals)
+                    ids = np.repeat(np.arange(len(group_keys)), sizes)
+                    sums = np.bincount(ids, weights=np.where(valid, vals, 0.0), minlength=len(group_keys))
+                    counts = np.bincount(ids, weights=valid, minlength=len(group_keys))
+                    with np.errstate(invalid='ignore'):
+                        means = np.where(counts > 0, sums / counts, float("-inf"))
+                    mean_by_key = dict(zip(group_keys, means))
+                    group_keys.sort(
+                        key=mean_by_key.__getitem__,
+                        reverse=(sort_groups_by == "mean_desc"),
+                    )
             # default: sorted by name (groupby already does this)
 
             # Limit groups
-            groups = groups[:max_groups]
+            group_keys = group_keys[:max_groups]
+
+            # Shared cache: each variable column converts to float64 once
+            # for the whole loop instead of once per group slice
+            column_cache: dict[str, tuple] = {}
+
+            def _group_stats(idx: np.ndarray) -> list[ColumnStats]:
+                return _calculate_many_column_stats(
+                    grouped_df, variables, columns_meta,
+                    treat_missing_as_zero, confidence_level,
+                    total_count_for_group_pct=sample_size,
+                    column_cache=column_cache, row_indices=idx,
+                )
+
+            if len(group_keys) * len(variables) >= 32 and len(group_keys) >= 4:
+                # Warm the cache serially so worker threads only read it;
+                # the NumPy reductions release the GIL, so groups overlap.
+                # Small jobs stay serial: scheduling would cost more than
+                # it saves
+                for var in variables:
+                    if var in grouped_df.columns and var not in column_cache:
+                        column_cache[var] = _column_values(grouped_df[var])
+                workers = min(len(group_keys), os.cpu_count() or 4)
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    stats_per_group = list(ex.map(
+                        _group_stats, (group_indices[key] for key in group_keys)
+                    ))
+            else:
+                stats_per_group = [
+                    _group_stats(group_indices[key]) for key in group_keys
+                ]
 
-            for group_vals, group_df in groups:
+            for group_vals, group_stats in zip(group_keys, stats_per_group):
+                idx = group_indices[group_vals]
                 if isinstance(group_vals, tuple):
                     group_key = " | ".join(str(v) for v in group_vals)
                     group_labels = {col: str(val) for col, val in zip(valid_group_by, group_vals)}
@@ -552,24 +938,13 @@ def calculate_descriptive_stats(
                     group_key = str(group_vals)
                     group_labels = {valid_group_by[0]: str(group_vals)}
 
-                group_stats_list = []
-                for col_key in variables:
-                    if col_key in group_df.columns:
-                        col_name = columns_meta.get(col_key, col_key)
-                        col_stats = calculate_column_stats(
-                            group_df[col_key].copy(), col_key, col_name,
-                            treat_missing_as_zero, confidence_level,
-                            total_count_for_group_pct=sample_size,
-                        )
-                        group_stats_list.append(col_stats)
-
-                grouped_stats[group_key] = group_stats_list
+                grouped_stats[group_key] = group_stats
 
                 group_summaries.append(GroupSummary(
                     group_key=group_key,
                     group_labels=group_labels,
-                    sample_size=len(group_df),
-                    pct_of_total=round(len(group_df) / sample_size * 100, 2) if sample_size > 0 else 0,
+                    sample_size=len(idx),
+                    pct_of_total=round(len(idx) / sample_size * 100, 2) if sample_size > 0 else 0,
                 ))
 
             # Comparison tests
@@ -578,6 +953,7 @@ def calculate_descriptive_stats(
                     grouped_df, variables, valid_group_by[0],
                     columns_meta, alpha=0.05,
                     treat_missing_as_zero=treat_missing_as_zero,
+                    precomputed_indices=group_indices,
                 )
 
     return sample_size, overall_stats, grouped_stats, group_summaries, comparison_tests, total_groups
@@ -600,34 +976,32 @@ def calculate_correlation_matrix(
     if len(valid_cols) < 2:
         return sample_size, [], []
 
-    subset = df[valid_cols].copy()
-    numeric_subset = pd.DataFrame()
-    for col in subset.columns:
-        numeric_subset[col] = pd.to_numeric(subset[col], errors='coerce')
+    # One contiguous float64 matrix instead of a column-by-column DataFrame;
+    # NaN policy and the constant-column filter then run as array ops and a
+    # single np.corrcoef call replaces the pandas pairwise path
+    mat = np.column_stack([
+        pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+        for col in valid_cols
+    ])
 
     if treat_missing_as_zero:
-        numeric_subset = numeric_subset.fillna(0)
+        mat = np.where(np.isnan(mat), 0.0, mat)
     else:
-        numeric_subset = numeric_subset.dropna()
+        mat = mat[~np.isnan(mat).any(axis=1)]
 
-    cols_to_keep = []
-    for col in numeric_subset.columns:
-        if numeric_subset[col].notna().any() and numeric_subset[col].std() > 0:
-            cols_to_keep.append(col)
+    # Drop empty/constant columns (std is NaN for n < 2, which also drops)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        stds = mat.std(axis=0, ddof=1)
+    keep = np.nan_to_num(stds) > 0
 
+    cols_to_keep = [col for col, k in zip(valid_cols, keep) if k]
     if len(cols_to_keep) < 2:
         return sample_size, [], []
 
-    numeric_subset = numeric_subset[cols_to_keep]
-    corr_matrix = numeric_subset.corr(method='pearson')
+    corr = np.corrcoef(mat[:, keep], rowvar=False)
+    corr = np.where(np.isnan(corr), 0.0, corr)
     var_names = [columns_meta.get(col, col) for col in cols_to_keep]
-
-    matrix = []
-    for row_col in cols_to_keep:
-        row = []
-        for col in cols_to_keep:
-            val = corr_matrix.loc[row_col, col]
-            row.append(round(float(val), 2) if not pd.isna(val) else 0.0)
-        matrix.append(row)
+    matrix = np.round(corr, 2).tolist()
 
     return sample_size, var_names, matrix
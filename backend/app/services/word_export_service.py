@@ -2,22 +2,37 @@
 Orion Analytics - Word Export Service
 Generates DOCX executive reports with Orion branding and full statistics.
 """
+import functools
 import io
+import math
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any
+from typing import IO, Optional, Any
 
 import pandas as pd
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
 from docx.shared import Pt, Inches, RGBColor
+from lxml import etree
 
 from app.schemas.schemas import FilterCondition
 from app.services.crosstab_service import calculate_crosstab
 from app.services.stats_service import calculate_descriptive_stats
 
 
+# Shared branding values, built once instead of per export
+_BASE_FONT_SIZE = Pt(10)
+_LOGO_WIDTH = Inches(2.2)
+_HEADING_COLOR = RGBColor(27, 42, 74)
+
+
+@functools.lru_cache(maxsize=1)
 def _resolve_logo_path() -> Optional[Path]:
-    """Resolve ORION wordmark path for report branding."""
+    """Resolve ORION wordmark path for report branding (probed once per process)."""
     here = Path(__file__).resolve()
     candidates = [
         here.parents[1] / "assets" / "orion-wordmark-only.png",  # backend/app/assets
@@ -30,17 +45,38 @@ def _resolve_logo_path() -> Optional[Path]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _logo_asset() -> Optional[tuple[str, bytes]]:
+    """(filename, contents) of the logo, read once so each export skips the disk round-trip."""
+    logo_path = _resolve_logo_path()
+    if not logo_path:
+        return None
+    try:
+        return logo_path.name, logo_path.read_bytes()
+    except OSError:
+        return None
+
+
+_INF = float("inf")
+
+# Pre-bound format specs for the precisions the report uses; _fmt runs
+# ~24 times per table row, so rebuilding a dynamic spec each call adds up
+_FMT_BY_DIGITS = {2: "{:.2f}".format, 4: "{:.4f}".format, 6: "{:.6f}".format}
+
+
 def _safe_num(value) -> Optional[float]:
     """Convert any numeric value to finite float."""
+    # Native floats — the overwhelming majority of stat fields — skip
+    # the conversion try/except entirely
+    if type(value) is float:
+        return value if math.isfinite(value) else None
     if value is None:
         return None
     try:
         number = float(value)
     except (TypeError, ValueError):
         return None
-    if pd.isna(number) or number in (float("inf"), float("-inf")):
-        return None
-    return number
+    return number if math.isfinite(number) else None
 
 
 def _fmt(value, digits: int = 4) -> str:
@@ -48,7 +84,8 @@ def _fmt(value, digits: int = 4) -> str:
     number = _safe_num(value)
     if number is None:
         return "-"
-    return f"{number:.{digits}f}"
+    bound = _FMT_BY_DIGITS.get(digits)
+    return bound(number) if bound is not None else f"{number:.{digits}f}"
 
 
 def _format_filter_summary(filters: Optional[list[FilterCondition]], columns_meta: dict[str, str]) -> str:
@@ -66,19 +103,23 @@ def _apply_base_style(document: Document):
     """Apply base typography style."""
     normal_style = document.styles["Normal"]
     normal_style.font.name = "Calibri"
-    normal_style.font.size = Pt(10)
+    normal_style.font.size = _BASE_FONT_SIZE
 
 
 def _add_logo_header(document: Document):
     """Insert Orion wordmark at top of document when available."""
-    logo_path = _resolve_logo_path()
-    if not logo_path:
+    logo = _logo_asset()
+    if not logo:
         return
+    filename, data = logo
     paragraph = document.add_paragraph()
     paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
     run = paragraph.add_run()
     try:
-        run.add_picture(str(logo_path), width=Inches(2.2))
+        picture = run.add_picture(io.BytesIO(data), width=_LOGO_WIDTH)
+        # A stream carries no filename; restore it so the embedded shape
+        # keeps the same metadata a path-based insert produced
+        picture._inline.graphic.graphicData.pic.nvPicPr.cNvPr.set("name", filename)
     except Exception:
         # Keep export resilient if image loading fails.
         return
@@ -87,8 +128,10 @@ def _add_logo_header(document: Document):
 def _add_section_title(document: Document, title: str, level: int = 1):
     """Add standardized section titles."""
     heading = document.add_heading(title, level=level)
-    heading_run = heading.runs[0] if heading.runs else heading.add_run(title)
-    heading_run.font.color.rgb = RGBColor(27, 42, 74)
+    # .runs builds a fresh list on every access; read it once
+    runs = heading.runs
+    heading_run = runs[0] if runs else heading.add_run(title)
+    heading_run.font.color.rgb = _HEADING_COLOR
     heading_run.font.bold = True
 
 
@@ -102,10 +145,41 @@ def _add_table(document: Document, headers: list[str], rows: list[list[Any]]):
         for run in header_cells[index].paragraphs[0].runs:
             run.font.bold = True
 
-    for row in rows:
-        row_cells = table.add_row().cells
-        for index, value in enumerate(row):
-            row_cells[index].text = "" if value is None else str(value)
+    if not rows:
+        return table
+
+    texts = [["" if value is None else str(value) for value in row] for row in rows]
+    if any("\t" in text or "\n" in text or "\r" in text for row in texts for text in row):
+        # Rare rich content goes through the python-docx setter, which
+        # expands tabs and line breaks into their proper elements
+        for row in texts:
+            row_cells = table.add_row().cells
+            for index, value in enumerate(row):
+                row_cells[index].text = value
+        return table
+
+    # Bulk path: python-docx re-walks the element tree for every cell
+    # assignment, which dominates for the large grouped tables. Cloning
+    # one <w:tr> template and filling the text nodes directly produces
+    # identical XML with a fraction of the overhead.
+    tbl = table._tbl
+    w_tc, w_p, w_r, w_t = qn("w:tc"), qn("w:p"), qn("w:r"), qn("w:t")
+    space_preserve = qn("xml:space")
+    template = deepcopy(tbl.tr_lst[0])
+    for tc in template.findall(w_tc):
+        for paragraph in tc.findall(w_p):
+            tc.remove(paragraph)
+        etree.SubElement(tc, w_p)
+    for row in texts:
+        tr = deepcopy(template)
+        for tc, text in zip(tr.findall(w_tc), row):
+            run = etree.SubElement(tc.find(w_p), w_r)
+            if text:
+                node = etree.SubElement(run, w_t)
+                node.text = text
+                if len(text.strip()) < len(text):
+                    node.set(space_preserve, "preserve")
+        tbl.append(tr)
     return table
 
 
@@ -115,11 +189,18 @@ def _build_executive_rows(grouped, variables: list[str], columns_meta: dict[str,
     if not grouped:
         return rows
 
+    # One {col_key: stat} index per group replaces a linear scan over the
+    # group's stats for every (variable, group) pair
+    stats_by_group = {
+        group_key: {stat.col_key: stat for stat in group_stats}
+        for group_key, group_stats in grouped.items()
+    }
+
     for variable in variables:
         variable_name = columns_meta.get(variable, variable)
         entries = []
-        for group_key, group_stats in grouped.items():
-            stat = next((item for item in group_stats if item.col_key == variable), None)
+        for group_key, stats_by_col in stats_by_group.items():
+            stat = stats_by_col.get(variable)
             if not stat or stat.mean is None:
                 continue
             entries.append((group_key, stat))
@@ -127,11 +208,29 @@ def _build_executive_rows(grouped, variables: list[str], columns_meta: dict[str,
         if not entries:
             continue
 
-        best = max(entries, key=lambda item: item[1].mean if item[1].mean is not None else float("-inf"))
-        worst = min(entries, key=lambda item: item[1].mean if item[1].mean is not None else float("inf"))
-        highest_cv = max(entries, key=lambda item: item[1].cv if item[1].cv is not None else float("-inf"))
-        highest_std = max(entries, key=lambda item: item[1].std if item[1].std is not None else float("-inf"))
-        largest_n = max(entries, key=lambda item: item[1].count if item[1].count is not None else 0)
+        # One pass tracks all five extrema; strict comparisons keep the
+        # first-winner tie behavior of the separate max/min calls
+        best = worst = highest_cv = highest_std = largest_n = entries[0]
+        first = entries[0][1]
+        best_mean = worst_mean = first.mean
+        top_cv = first.cv if first.cv is not None else -_INF
+        top_std = first.std if first.std is not None else -_INF
+        top_n = first.count if first.count is not None else 0
+        for entry in entries[1:]:
+            stat = entry[1]
+            if stat.mean > best_mean:
+                best_mean, best = stat.mean, entry
+            if stat.mean < worst_mean:
+                worst_mean, worst = stat.mean, entry
+            cv = stat.cv if stat.cv is not None else -_INF
+            if cv > top_cv:
+                top_cv, highest_cv = cv, entry
+            std = stat.std if stat.std is not None else -_INF
+            if std > top_std:
+                top_std, highest_std = std, entry
+            count = stat.count if stat.count is not None else 0
+            if count > top_n:
+                top_n, largest_n = count, entry
         spread = (best[1].mean - worst[1].mean) if best[1].mean is not None and worst[1].mean is not None else None
 
         rows.append([
@@ -166,19 +265,21 @@ def _build_group_summary_rows(group_summaries) -> list[list[Any]]:
 
 def _build_group_detailed_rows(grouped, group_summaries) -> list[list[Any]]:
     """Rows for complete group-by-variable statistics table."""
-    group_n_map = {}
-    group_pct_map = {}
-    for summary in group_summaries or []:
-        group_n_map[summary.group_key] = summary.sample_size
-        group_pct_map[summary.group_key] = summary.pct_of_total
+    group_n_map = {summary.group_key: summary.sample_size for summary in group_summaries or []}
+    group_pct_map = {summary.group_key: summary.pct_of_total for summary in group_summaries or []}
 
     rows = []
+    rows_append = rows.append
     for group_key, group_stats in grouped.items():
+        # Shared by every variable row of the group; no reason to refetch
+        # and reformat them per stat
+        group_n = group_n_map.get(group_key, "-")
+        group_pct = _fmt(group_pct_map.get(group_key), 2)
         for stat in group_stats:
-            rows.append([
+            rows_append([
                 group_key,
-                group_n_map.get(group_key, "-"),
-                _fmt(group_pct_map.get(group_key), 2),
+                group_n,
+                group_pct,
                 stat.name,
                 stat.count,
                 stat.missing_count,
@@ -253,6 +354,12 @@ def _build_test_rows(tests) -> list[list[Any]]:
 
 def _to_filter_conditions(raw_filters: Optional[list[Any]]) -> list[FilterCondition]:
     """Normalize raw filter payload into schema-safe FilterCondition list."""
+    if not raw_filters:
+        return []
+    # Common case: the FastAPI layer already validated the payload, so
+    # skip re-running Pydantic validation item by item
+    if all(type(item) is FilterCondition for item in raw_filters):
+        return list(raw_filters)
     normalized = []
     for item in raw_filters or []:
         if isinstance(item, FilterCondition):
@@ -271,6 +378,56 @@ def _to_filter_conditions(raw_filters: Optional[list[Any]]) -> list[FilterCondit
     return normalized
 
 
+def _descriptive_stats_cached(
+    cache: dict,
+    df: pd.DataFrame,
+    variables: list[str],
+    columns_meta: dict[str, str],
+    filters: Optional[list[FilterCondition]],
+    group_by: Optional[list[str]],
+    treat_missing_as_zero: bool,
+    confidence_level: float,
+    run_comparison_tests: bool,
+    max_groups: int,
+):
+    """
+    calculate_descriptive_stats with per-export memoization: composite
+    blocks often repeat the exact scope of the top-level report, and this
+    turns the second full pandas pass into a dict lookup. The cache lives
+    for one export only, so it can never serve stale data.
+    """
+    try:
+        key = (
+            tuple(variables),
+            tuple(group_by or []),
+            tuple((c.col_key, tuple(c.values)) for c in filters or []),
+            bool(treat_missing_as_zero),
+            confidence_level,
+            bool(run_comparison_tests),
+            max_groups,
+        )
+    except TypeError:
+        key = None
+
+    if key is not None and key in cache:
+        return cache[key]
+
+    result = calculate_descriptive_stats(
+        df=df,
+        variables=variables,
+        columns_meta=columns_meta,
+        filters=filters,
+        group_by=group_by,
+        treat_missing_as_zero=bool(treat_missing_as_zero),
+        confidence_level=confidence_level,
+        run_comparison_tests=run_comparison_tests,
+        max_groups=max_groups,
+    )
+    if key is not None:
+        cache[key] = result
+    return result
+
+
 def _safe_int(value: Any, default: int) -> int:
     try:
         parsed = int(value)
@@ -289,20 +446,19 @@ def _safe_float_conf(value: Any, default: float = 0.95) -> float:
     return parsed
 
 
-def _add_descriptive_composite_block(
-    document: Document,
+def _compute_descriptive_block(
     df: pd.DataFrame,
     columns_meta: dict[str, str],
     payload: dict[str, Any],
     default_filters: Optional[list[FilterCondition]],
     default_treat_missing: bool,
-):
-    """Render one descriptive section in composite report."""
+    stats_cache: dict,
+) -> dict[str, Any]:
+    """Pandas-heavy half of a descriptive section; returns data for rendering."""
     variables = payload.get("variables") if isinstance(payload.get("variables"), list) else []
     variables = [str(variable) for variable in variables if str(variable) in df.columns]
     if not variables:
-        document.add_paragraph("Bloco ignorado: nenhuma variavel valida encontrada para analise descritiva.")
-        return
+        return {"skip": "Bloco ignorado: nenhuma variavel valida encontrada para analise descritiva."}
 
     group_by = payload.get("group_by") if isinstance(payload.get("group_by"), list) else []
     group_by = [str(group) for group in group_by if str(group) in df.columns]
@@ -315,7 +471,8 @@ def _add_descriptive_composite_block(
     confidence_level = _safe_float_conf(payload.get("confidence_level"), default=0.95)
     max_groups = _safe_int(payload.get("max_groups"), default=200)
 
-    sample_size, stats, grouped, summaries, tests, total_groups = calculate_descriptive_stats(
+    result = _descriptive_stats_cached(
+        stats_cache,
         df=df,
         variables=variables,
         columns_meta=columns_meta,
@@ -326,6 +483,28 @@ def _add_descriptive_composite_block(
         run_comparison_tests=run_comparison_tests,
         max_groups=max_groups,
     )
+    return {
+        "variables": variables,
+        "group_by": group_by,
+        "filters": filters,
+        "result": result,
+    }
+
+
+def _render_descriptive_block(
+    document: Document,
+    columns_meta: dict[str, str],
+    data: dict[str, Any],
+):
+    """Docx half of a descriptive section (must run on the main thread)."""
+    if "skip" in data:
+        document.add_paragraph(data["skip"])
+        return
+
+    variables = data["variables"]
+    group_by = data["group_by"]
+    filters = data["filters"]
+    sample_size, stats, grouped, summaries, tests, total_groups = data["result"]
 
     scope_rows = [
         ["Amostra", sample_size],
@@ -391,23 +570,20 @@ def _add_descriptive_composite_block(
         _add_table(document, test_headers, test_rows if test_rows else [["-"] * len(test_headers)])
 
 
-def _add_crosstab_composite_block(
-    document: Document,
+def _compute_crosstab_block(
     df: pd.DataFrame,
     columns_meta: dict[str, str],
     payload: dict[str, Any],
     default_filters: Optional[list[FilterCondition]],
     default_treat_missing: bool,
-):
-    """Render one crosstab section in composite report."""
+) -> dict[str, Any]:
+    """Pandas-heavy half of a crosstab section; returns data for rendering."""
     row_variable = str(payload.get("row_variable", "")).strip()
     col_variable = str(payload.get("col_variable", "")).strip()
     if not row_variable or not col_variable:
-        document.add_paragraph("Bloco ignorado: row_variable e col_variable sao obrigatorias no crosstab.")
-        return
+        return {"skip": "Bloco ignorado: row_variable e col_variable sao obrigatorias no crosstab."}
     if row_variable not in df.columns or col_variable not in df.columns:
-        document.add_paragraph("Bloco ignorado: variaveis do crosstab nao encontradas no dataset atual.")
-        return
+        return {"skip": "Bloco ignorado: variaveis do crosstab nao encontradas no dataset atual."}
 
     filters = _to_filter_conditions(payload.get("filters"))
     if not filters:
@@ -426,6 +602,21 @@ def _add_crosstab_composite_block(
         max_cols=max_cols,
         treat_missing_as_zero=bool(treat_missing_as_zero),
     )
+    return {"filters": filters, "result": result}
+
+
+def _render_crosstab_block(
+    document: Document,
+    columns_meta: dict[str, str],
+    data: dict[str, Any],
+):
+    """Docx half of a crosstab section (must run on the main thread)."""
+    if "skip" in data:
+        document.add_paragraph(data["skip"])
+        return
+
+    filters = data["filters"]
+    result = data["result"]
 
     info_rows = [
         ["Variavel de linhas", result.row_variable_name],
@@ -525,6 +716,7 @@ def _add_composite_sections(
     report_sections: Optional[list[dict[str, Any]]],
     default_filters: Optional[list[FilterCondition]],
     default_treat_missing: bool,
+    stats_cache: dict,
 ):
     """Render user-composed analysis blocks inside the exported report."""
     if not report_sections:
@@ -537,7 +729,43 @@ def _add_composite_sections(
         document.add_paragraph("Nenhum bloco valido encontrado no relatorio composto.")
         return
 
-    for index, section in enumerate(valid_sections, start=1):
+    # Phase 1: the pandas-heavy half of each block. The blocks are
+    # independent, so when several need computing they overlap on a
+    # thread pool (the stats and crosstab services release the GIL in
+    # NumPy/pandas code); python-docx is not thread-safe, so all
+    # rendering stays on this thread in phase 2.
+    compute_jobs = []
+    for section in valid_sections:
+        section_type = str(section.get("section_type", "")).strip().lower()
+        payload = section.get("payload") if isinstance(section.get("payload"), dict) else {}
+        if section_type == "descriptive":
+            job = functools.partial(
+                _compute_descriptive_block,
+                df, columns_meta, payload,
+                default_filters, default_treat_missing, stats_cache,
+            )
+        elif section_type == "crosstab":
+            job = functools.partial(
+                _compute_crosstab_block,
+                df, columns_meta, payload,
+                default_filters, default_treat_missing,
+            )
+        else:
+            job = None
+        compute_jobs.append(job)
+
+    resolvers: list[Any] = compute_jobs
+    pending = [job for job in compute_jobs if job is not None]
+    if len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(pending))) as ex:
+            futures = [ex.submit(job) if job is not None else None for job in compute_jobs]
+        # Exiting the pool waits for completion; failures re-raise from
+        # .result() inside the per-block try below, keeping the same
+        # error paragraph as the serial path
+        resolvers = [future.result if future is not None else None for future in futures]
+
+    # Phase 2: serial rendering in the user's section order
+    for index, (section, resolve) in enumerate(zip(valid_sections, resolvers), start=1):
         section_type = str(section.get("section_type", "")).strip().lower()
         title = str(section.get("title", f"Bloco {index}"))
         created_at = section.get("created_at")
@@ -550,23 +778,9 @@ def _add_composite_sections(
 
         try:
             if section_type == "descriptive":
-                _add_descriptive_composite_block(
-                    document=document,
-                    df=df,
-                    columns_meta=columns_meta,
-                    payload=payload,
-                    default_filters=default_filters,
-                    default_treat_missing=default_treat_missing,
-                )
+                _render_descriptive_block(document, columns_meta, resolve())
             elif section_type == "crosstab":
-                _add_crosstab_composite_block(
-                    document=document,
-                    df=df,
-                    columns_meta=columns_meta,
-                    payload=payload,
-                    default_filters=default_filters,
-                    default_treat_missing=default_treat_missing,
-                )
+                _render_crosstab_block(document, columns_meta, resolve())
             elif section_type == "ml":
                 _add_ml_composite_block(
                     document=document,
@@ -586,30 +800,44 @@ def create_word_export(
     group_by: Optional[list[str]] = None,
     treat_missing_as_zero: bool = True,
     report_sections: Optional[list[dict[str, Any]]] = None,
-) -> io.BytesIO:
+) -> IO[bytes]:
     """Create DOCX report with complete statistics and executive interpretation."""
-    sample_size, stats, grouped, summaries, tests, total_groups = calculate_descriptive_stats(
-        df=df,
-        variables=variables,
-        columns_meta=columns_meta,
-        filters=filters,
-        group_by=group_by,
-        treat_missing_as_zero=treat_missing_as_zero,
-        run_comparison_tests=True if group_by else False,
-        max_groups=200,
-    )
-
-    document = Document()
-    _apply_base_style(document)
-    _add_logo_header(document)
-
-    title = document.add_heading("Relatorio Executivo Orion - Estatisticas", level=0)
-    title.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    title_run = title.runs[0] if title.runs else title.add_run("Relatorio Executivo Orion - Estatisticas")
-    title_run.font.color.rgb = RGBColor(27, 42, 74)
-
-    subtitle = document.add_paragraph(f"Gerado em {pd.Timestamp.now().strftime('%d/%m/%Y %H:%M:%S')}")
-    subtitle.runs[0].font.size = Pt(10)
+    # Shared for this export only: composite blocks that repeat a scope
+    # (often the top-level one) reuse the computed stats instead of
+    # re-running the full pandas pass
+    stats_cache: dict = {}
+    # The stats pass and the document skeleton are independent; run the
+    # NumPy/pandas work (which releases the GIL) in a worker while this
+    # thread parses the blank document and lays out the header
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stats_future = executor.submit(
+            _descriptive_stats_cached,
+            stats_cache,
+            df=df,
+            variables=variables,
+            columns_meta=columns_meta,
+            filters=filters,
+            group_by=group_by,
+            treat_missing_as_zero=treat_missing_as_zero,
+            confidence_level=0.95,
+            run_comparison_tests=True if group_by else False,
+            max_groups=200,
+        )
+
+        document = Document()
+        _apply_base_style(document)
+        _add_logo_header(document)
+
+        title = document.add_heading("Relatorio Executivo Orion - Estatisticas", level=0)
+        title.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        title_runs = title.runs
+        title_run = title_runs[0] if title_runs else title.add_run("Relatorio Executivo Orion - Estatisticas")
+        title_run.font.color.rgb = _HEADING_COLOR
+
+        subtitle = document.add_paragraph(f"Gerado em {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+        subtitle.runs[0].font.size = _BASE_FONT_SIZE
+
+        sample_size, stats, grouped, summaries, tests, total_groups = stats_future.result()
 
     _add_section_title(document, "1. Escopo da Analise", level=1)
     scope_headers = ["Indicador", "Valor"]
@@ -688,8 +916,10 @@ def create_word_export(
         "Grupos com CV% alto indicam instabilidade operacional.",
         "Use o grupo com maior media e baixa variabilidade como benchmark.",
     ]
+    # Resolve the style once instead of by name for every bullet
+    bullet_style = document.styles["List Bullet"]
     for bullet in bullets:
-        document.add_paragraph(bullet, style="List Bullet")
+        document.add_paragraph(bullet, style=bullet_style)
 
     _add_composite_sections(
         document=document,
@@ -698,9 +928,13 @@ def create_word_export(
         report_sections=report_sections,
         default_filters=filters,
         default_treat_missing=treat_missing_as_zero,
+        stats_cache=stats_cache,
     )
 
-    buffer = io.BytesIO()
+    # Small reports stay in memory; big ones (many composite sections,
+    # large grouped tables) spill to disk instead of holding the whole
+    # serialized zip in RAM per concurrent request
+    buffer = tempfile.SpooledTemporaryFile(max_size=4 << 20)
     document.save(buffer)
     buffer.seek(0)
     return buffer